@@ -14,6 +14,7 @@ from _babase import (
     ContextRef,
     ContextCall,
     apptime,
+    apptime_cached,
     apptimer,
     AppTimer,
     displaytime,
@@ -149,6 +150,7 @@ __all__ = [
     'WidgetNotFoundError',
     'AppTime',
     'apptime',
+    'apptime_cached',
     'apptimer',
     'AppTimer',
     'SimpleSound',
@@ -9,10 +9,21 @@ from typing import TYPE_CHECKING
 import _babase
 import _bauiv1
 import _bascenev1
+from babase._language import Lstr
 
 if TYPE_CHECKING:
     from typing import Callable, Any
 
+# This message never changes, so just build it once. (Lstrs are not
+# modified when displayed so it is safe to share this instance).
+_REMOVE_ADS_MSG = Lstr(
+    resource='removeInGameAdsText',
+    subs=[
+        ('${PRO}', Lstr(resource='store.bombSquadProNameText')),
+        ('${APP_NAME}', Lstr(resource='titleText')),
+    ],
+)
+
 
 class AdsSubsystem:
     """Subsystem for ads functionality in the app.
@@ -32,31 +43,31 @@ class AdsSubsystem:
         self.last_ad_completion_time: float | None = None
         self.last_ad_was_short = False
 
+        # Shared empty context for scheduling our timers. Note that a
+        # ContextRef stores its previous context when entered, so this
+        # must never be entered re-entrantly.
+        self._empty_context: _babase.ContextRef | None = None
+
+    def _get_empty_context(self) -> _babase.ContextRef:
+        # ContextRefs must be created in the logic thread, so we make
+        # this on first use instead of in our constructor.
+        if self._empty_context is None:
+            self._empty_context = _babase.ContextRef.empty()
+        return self._empty_context
+
     def do_remove_in_game_ads_message(self) -> None:
         """(internal)"""
-        from babase._language import Lstr
-
         # Print this message once every 10 minutes at most.
-        tval = _babase.apptime()
+        tval = _babase.apptime_cached()
         if self.last_in_game_ad_remove_message_show_time is None or (
             tval - self.last_in_game_ad_remove_message_show_time > 60 * 10
         ):
             self.last_in_game_ad_remove_message_show_time = tval
-            with _babase.ContextRef.empty():
+            with self._get_empty_context():
                 _babase.apptimer(
                     1.0,
                     lambda: _babase.screenmessage(
-                        Lstr(
-                            resource='removeInGameAdsText',
-                            subs=[
-                                (
-                                    '${PRO}',
-                                    Lstr(resource='store.bombSquadProNameText'),
-                                ),
-                                ('${APP_NAME}', Lstr(resource='titleText')),
-                            ],
-                        ),
-                        color=(1, 1, 0),
+                        _REMOVE_ADS_MSG, color=(1, 1, 0)
                     ),
                 )
 
@@ -87,21 +98,19 @@ class AdsSubsystem:
         classic = app.classic
         assert plus is not None
         assert classic is not None
-        show = True
 
-        # No ads without net-connections, etc.
-        if not _bauiv1.can_show_ad():
+        # No ads without net-connections, etc. Pro also disables
+        # interstitials. Check these cheap ones first so we don't bother
+        # looking at the session if we don't need to.
+        if not _bauiv1.can_show_ad() or classic.accounts.have_pro():
             show = False
-        if classic.accounts.have_pro():
-            show = False  # Pro disables interstitials.
-        try:
-            session = _bascenev1.get_foreground_host_session()
-            assert session is not None
-            is_tournament = session.tournament_id is not None
-        except Exception:
-            is_tournament = False
-        if is_tournament:
-            show = False  # Never show ads during tournaments.
+        else:
+            # Never show ads during tournaments.
+            try:
+                session = _bascenev1.get_foreground_host_session()
+                show = session is None or session.tournament_id is None
+            except Exception:
+                show = True
 
         if show:
             interval: float | None
@@ -129,20 +138,23 @@ class AdsSubsystem:
                 # (we reach our threshold faster the longer we've been
                 # playing).
                 base = 'ads' if _bauiv1.has_video_ads() else 'ads2'
-                min_lc = plus.get_v1_account_misc_read_val(base + '.minLC', 0.0)
-                max_lc = plus.get_v1_account_misc_read_val(base + '.maxLC', 5.0)
-                min_lc_scale = plus.get_v1_account_misc_read_val(
-                    base + '.minLCScale', 0.25
-                )
-                max_lc_scale = plus.get_v1_account_misc_read_val(
-                    base + '.maxLCScale', 0.34
-                )
-                min_lc_interval = plus.get_v1_account_misc_read_val(
-                    base + '.minLCInterval', 360
-                )
-                max_lc_interval = plus.get_v1_account_misc_read_val(
-                    base + '.maxLCInterval', 300
+                vals = plus.get_v1_account_misc_read_vals(
+                    base,
+                    {
+                        'minLC': 0.0,
+                        'maxLC': 5.0,
+                        'minLCScale': 0.25,
+                        'maxLCScale': 0.34,
+                        'minLCInterval': 360,
+                        'maxLCInterval': 300,
+                    },
                 )
+                min_lc = vals['minLC']
+                max_lc = vals['maxLC']
+                min_lc_scale = vals['minLCScale']
+                max_lc_scale = vals['maxLCScale']
+                min_lc_interval = vals['minLCInterval']
+                max_lc_interval = vals['maxLCInterval']
                 if launch_count < min_lc:
                     lc_amt = 0.0
                 elif launch_count > max_lc:
@@ -166,7 +178,7 @@ class AdsSubsystem:
                 self.last_ad_completion_time is None
                 or (
                     interval is not None
-                    and _babase.apptime() - self.last_ad_completion_time
+                    and _babase.apptime_cached() - self.last_ad_completion_time
                     > (interval * interval_mult)
                 )
             ):
@@ -177,36 +189,40 @@ class AdsSubsystem:
 
         # If we're *still* cleared to show, actually tell the system to show.
         if show:
-            # As a safety-check, set up an object that will run
+            # As a safety-check, set up a payload that will run
             # the completion callback if we've returned and sat for 10 seconds
             # (in case some random ad network doesn't properly deliver its
             # completion callback).
-            class _Payload:
-                def __init__(self, pcall: Callable[[], Any]):
-                    self._call = pcall
-                    self._ran = False
-
-                def run(self, fallback: bool = False) -> None:
-                    """Run fallback call (and issue a warning about it)."""
-                    assert app.classic is not None
-                    if not self._ran:
-                        if fallback:
-                            lanst = app.classic.ads.last_ad_network_set_time
-                            print(
-                                'ERROR: relying on fallback ad-callback! '
-                                'last network: '
-                                + app.classic.ads.last_ad_network
-                                + ' (set '
-                                + str(int(time.time() - lanst))
-                                + 's ago); purpose='
-                                + app.classic.ads.last_ad_purpose
-                            )
-                        _babase.pushcall(self._call)
-                        self._ran = True
-
-            payload = _Payload(call)
-            with _babase.ContextRef.empty():
-                _babase.apptimer(5.0, lambda: payload.run(fallback=True))
-            self.show_ad('between_game', on_completion_call=payload.run)
+            run = _make_payload(call)
+            with self._get_empty_context():
+                _babase.apptimer(5.0, lambda: run(fallback=True))
+            self.show_ad('between_game', on_completion_call=run)
         else:
             _babase.pushcall(call)  # Just run the callback without the ad.
+
+
+def _make_payload(call: Callable[[], Any]) -> Callable[..., None]:
+    """Wrap a call so it only runs once (via ad completion or fallback)."""
+    ran = [False]
+
+    def run(fallback: bool = False) -> None:
+        """Run the call (and issue a warning if this is a fallback)."""
+        if ran[0]:
+            return
+        if fallback:
+            classic = _babase.app.classic
+            assert classic is not None
+            ads = classic.ads
+            print(
+                'ERROR: relying on fallback ad-callback! '
+                'last network: '
+                + ads.last_ad_network
+                + ' (set '
+                + str(int(time.time() - ads.last_ad_network_set_time))
+                + 's ago); purpose='
+                + ads.last_ad_purpose
+            )
+        _babase.pushcall(call)
+        ran[0] = True
+
+    return run
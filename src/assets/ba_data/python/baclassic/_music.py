@@ -89,6 +89,7 @@ class MusicSubsystem:
     def __init__(self) -> None:
         # pylint: disable=cyclic-import
         # self._music_node: _bascenev1.Node | None = None
+        self._user_agent_string: str | None = None
         self._playing_internal_music = False
         self._music_mode: MusicPlayMode = MusicPlayMode.REGULAR
         self._music_player: MusicPlayer | None = None
@@ -169,8 +170,12 @@ class MusicSubsystem:
 
     def supports_soundtrack_entry_type(self, entry_type: str) -> bool:
         """Return whether provided soundtrack entry type is supported here."""
-        uas = _babase.env()['user_agent_string']
-        assert isinstance(uas, str)
+        # This never changes while we're running, so only fetch it once.
+        uas = self._user_agent_string
+        if uas is None:
+            uas = _babase.env()['user_agent_string']
+            assert isinstance(uas, str)
+            self._user_agent_string = uas
 
         # FIXME: Generalize this.
         if entry_type == 'iTunesPlaylist':
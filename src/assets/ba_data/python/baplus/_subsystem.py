@@ -88,6 +88,21 @@ class PlusSubsystem:
         """(internal)"""
         return _baplus.get_v1_account_misc_read_val_2(name, default_value)
 
+    @staticmethod
+    def get_v1_account_misc_read_vals(
+        prefix: str, defaults: dict[str, Any]
+    ) -> dict[str, Any]:
+        """(internal)
+
+        Fetch multiple misc-read-vals sharing a common prefix at once.
+        Keys in the returned dict match those in defaults (sans prefix).
+        """
+        getval = _baplus.get_v1_account_misc_read_val
+        return {
+            key: getval(f'{prefix}.{key}', default)
+            for key, default in defaults.items()
+        }
+
     @staticmethod
     def get_v1_account_misc_val(name: str, default_value: Any) -> Any:
         """(internal)"""
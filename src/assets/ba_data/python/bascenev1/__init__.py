@@ -30,6 +30,7 @@ from _babase import (
     increment_analytics_count,
     set_analytics_screen,
     apptime,
+    apptime_cached,
     apptimer,
     AppTimer,
     displaytime,
@@ -368,6 +369,7 @@ __all__ = [
     'get_game_roster',
     'AppTime',
     'apptime',
+    'apptime_cached',
     'apptimer',
     'AppTimer',
     'ContextRef',
@@ -24,9 +24,10 @@ def launch_main_menu_session() -> None:
 
 def get_player_icon(sessionplayer: bascenev1.SessionPlayer) -> dict[str, Any]:
     info = sessionplayer.get_icon_info()
+    gettexture = _bascenev1.gettexture
     return {
-        'texture': _bascenev1.gettexture(info['texture']),
-        'tint_texture': _bascenev1.gettexture(info['tint_texture']),
+        'texture': gettexture(info['texture']),
+        'tint_texture': gettexture(info['tint_texture']),
         'tint_color': info['tint_color'],
         'tint2_color': info['tint2_color'],
     }
@@ -45,9 +46,10 @@ def filter_chat_message(msg: str, client_id: int) -> str | None:
 
 
 def local_chat_message(msg: str) -> None:
-    assert _babase.app.classic is not None
-    if (
-        _babase.app.classic.ui.party_window is not None
-        and _babase.app.classic.ui.party_window() is not None
-    ):
-        _babase.app.classic.ui.party_window().on_chat_message(msg)
+    classic = _babase.app.classic
+    assert classic is not None
+    party_window_ref = classic.ui.party_window
+    if party_window_ref is not None:
+        party_window = party_window_ref()
+        if party_window is not None:
+            party_window.on_chat_message(msg)
@@ -19,6 +19,17 @@ import bascenev1 as bs
 if TYPE_CHECKING:
     from typing import Any, Sequence
 
+# Bound once since these get hit for every light we spawn when scoring.
+_newnode = bs.newnode
+_timer = bs.timer
+_animate = bs.animate
+_apptime_cached = bs.apptime_cached
+
+# Intensity curves for our lights (animate() doesn't modify these so we
+# can safely share them).
+_FLASH_CURVE = {0: 0, 0.25: 2.0, 0.5: 0}
+_SPARK_CURVE = {0: 0, 0.1: 1.0, 0.5: 0}
+
 
 class Player(bs.Player['Team']):
     """Our player type for this game."""
@@ -109,7 +120,7 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
     def create_team(self, sessionteam: bs.SessionTeam) -> Team:
         shared = SharedObjects.get()
         base_pos = self.map.get_flag_position(sessionteam.id)
-        bs.newnode(
+        _newnode(
             'light',
             attrs={
                 'position': base_pos,
@@ -138,14 +149,14 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
             ),
         )
 
-        bs.newnode(
+        _newnode(
             'region',
             owner=flag.node,
             attrs={
                 'position': (base_pos[0], base_pos[1] + 0.75, base_pos[2]),
                 'scale': (0.5, 0.5, 0.5),
                 'type': 'sphere',
-                'materials': [self._base_region_materials[sessionteam.id]],
+                'materials': [mat],
             },
         )
 
@@ -169,7 +180,7 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
             super().handlemessage(msg)
 
     def _flash_base(self, team: Team, length: float = 2.0) -> None:
-        light = bs.newnode(
+        light = _newnode(
             'light',
             attrs={
                 'position': team.base_pos,
@@ -178,8 +189,8 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
                 'color': team.color,
             },
         )
-        bs.animate(light, 'intensity', {0: 0, 0.25: 2.0, 0.5: 0}, loop=True)
-        bs.timer(length, light.delete)
+        _animate(light, 'intensity', _FLASH_CURVE, loop=True)
+        _timer(length, light.delete)
 
     def _handle_base_collide(self, team: Team) -> None:
         try:
@@ -199,53 +210,56 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
         player_team = player.team
         if player_team is not team:
             # Prevent multiple simultaneous scores.
-            if bs.apptime() != self._last_score_time:
-                self._last_score_time = bs.apptime()
+            now = _apptime_cached()
+            if now != self._last_score_time:
+                self._last_score_time = now
                 self.stats.player_scored(player, 50, big_message=True)
                 self._score_sound.play()
                 self._flash_base(team)
 
                 # Move all players on the scoring team back to their start
-                # and add flashes of light so its noticeable.
-                for player in player_team.players:
+                # and add flashes of light so its noticeable. Also have
+                # them celebrate.
+                team_color = player_team.color
+                team_id = player_team.id
+                get_start_position = self.map.get_start_position
+                teammates = player_team.players
+                for player in teammates:
                     if player.is_alive():
                         pos = player.node.position
-                        light = bs.newnode(
+                        light = _newnode(
                             'light',
                             attrs={
                                 'position': pos,
-                                'color': player_team.color,
+                                'color': team_color,
                                 'height_attenuated': False,
                                 'radius': 0.4,
                             },
                         )
-                        bs.timer(0.5, light.delete)
-                        bs.animate(light, 'intensity', {0: 0, 0.1: 1.0, 0.5: 0})
+                        _timer(0.5, light.delete)
+                        _animate(light, 'intensity', _SPARK_CURVE)
 
-                        new_pos = self.map.get_start_position(player_team.id)
-                        light = bs.newnode(
+                        new_pos = get_start_position(team_id)
+                        light = _newnode(
                             'light',
                             attrs={
                                 'position': new_pos,
-                                'color': player_team.color,
+                                'color': team_color,
                                 'radius': 0.4,
                                 'height_attenuated': False,
                             },
                         )
-                        bs.timer(0.5, light.delete)
-                        bs.animate(light, 'intensity', {0: 0, 0.1: 1.0, 0.5: 0})
+                        _timer(0.5, light.delete)
+                        _animate(light, 'intensity', _SPARK_CURVE)
                         if player.actor:
                             player.actor.handlemessage(
                                 bs.StandMessage(new_pos, random.uniform(0, 360))
                             )
-
-                # Have teammates celebrate.
-                for player in player_team.players:
                     if player.actor:
                         player.actor.handlemessage(bs.CelebrateMessage(2.0))
 
                 player_team.score += 1
-                self._update_scoreboard()
+                self._update_scoreboard(player_team)
                 if player_team.score >= self._score_to_win:
                     self.end_game()
 
@@ -255,8 +269,10 @@ class AssaultGame(bs.TeamGameActivity[Player, Team]):
             results.set_team_score(team, team.score)
         self.end(results=results)
 
-    def _update_scoreboard(self) -> None:
-        for team in self.teams:
+    def _update_scoreboard(self, changed_team: Team | None = None) -> None:
+        # If we know only a single team's score changed, just update it.
+        teams = self.teams if changed_team is None else [changed_team]
+        for team in teams:
             self._scoreboard.set_team_value(
                 team, team.score, self._score_to_win
             )
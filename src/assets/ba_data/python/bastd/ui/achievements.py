@@ -7,33 +7,30 @@ from __future__ import annotations
 from bastd.ui.popup import PopupWindow
 import bauiv1 as bui
 
+# Default scale and height for our window per ui-scale; indexed by
+# UIScale value (LARGE, MEDIUM, SMALL).
+_SIZES = ((1.23, 450), (1.65, 370), (2.3, 300))
+
 
 class AchievementsWindow(PopupWindow):
     """Popup window to view achievements."""
 
+    # Rows we build up front (roughly what is initially visible) and
+    # how many more we add per cycle after that.
+    _INITIAL_ROWS = 12
+    _ROWS_PER_BATCH = 8
+
     def __init__(
         self, position: tuple[float, float], scale: float | None = None
     ):
         # pylint: disable=too-many-locals
-        assert bui.app.classic is not None
-        uiscale = bui.app.classic.ui.uiscale
+        classic = bui.app.classic
+        assert classic is not None
+        scale_default, self._height = _SIZES[classic.ui.uiscale.value]
         if scale is None:
-            scale = (
-                2.3
-                if uiscale is bui.UIScale.SMALL
-                else 1.65
-                if uiscale is bui.UIScale.MEDIUM
-                else 1.23
-            )
+            scale = scale_default
         self._transitioning_out = False
         self._width = 450
-        self._height = (
-            300
-            if uiscale is bui.UIScale.SMALL
-            else 370
-            if uiscale is bui.UIScale.MEDIUM
-            else 450
-        )
         bg_color = (0.5, 0.4, 0.6)
 
         # creates our _root_widget
@@ -57,16 +54,15 @@ class AchievementsWindow(PopupWindow):
             iconscale=1.2,
         )
 
-        achievements = bui.app.classic.ach.achievements
-        num_complete = len([a for a in achievements if a.complete])
+        achievements = classic.ach.achievements
+        num_complete = 0
+        total_pts = 0
+        for ach in achievements:
+            if ach.complete:
+                num_complete += 1
+                total_pts += ach.power_ranking_value
 
-        txt_final = bui.Lstr(
-            resource='accountSettingsWindow.achievementProgressText',
-            subs=[
-                ('${COUNT}', str(num_complete)),
-                ('${TOTAL}', str(len(achievements))),
-            ],
-        )
+        # Our title gets filled in once our list is built.
         self._title_text = bui.textwidget(
             parent=self.root_widget,
             position=(self._width * 0.5, self._height - 20),
@@ -74,7 +70,7 @@ class AchievementsWindow(PopupWindow):
             h_align='center',
             v_align='center',
             scale=0.6,
-            text=txt_final,
+            text='',
             maxwidth=200,
             color=(1, 1, 1, 0.4),
         )
@@ -97,7 +93,6 @@ class AchievementsWindow(PopupWindow):
         sub_height = 40 + len(achievements) * incr
 
         eq_rsrc = 'coopSelectWindow.powerRankingPointsEqualsText'
-        pts_rsrc = 'coopSelectWindow.powerRankingPointsText'
 
         self._subcontainer = bui.containerwidget(
             parent=self._scrollwidget,
@@ -105,12 +100,96 @@ class AchievementsWindow(PopupWindow):
             background=False,
         )
 
-        total_pts = 0
-        for i, ach in enumerate(achievements):
+        bui.textwidget(
+            parent=self._subcontainer,
+            position=(
+                sub_width * 1.0,
+                sub_height - 20 - incr * len(achievements),
+            ),
+            maxwidth=sub_width * 0.5,
+            scale=0.7,
+            color=(0.7, 0.8, 1.0),
+            flatness=1.0,
+            shadow=0.0,
+            text=bui.Lstr(
+                value='${A} ${B}',
+                subs=[
+                    ('${A}', bui.Lstr(resource='coopSelectWindow.totalText')),
+                    (
+                        '${B}',
+                        bui.Lstr(
+                            resource=eq_rsrc,
+                            subs=[('${NUMBER}', str(total_pts))],
+                        ),
+                    ),
+                ],
+            ),
+            size=(0, 0),
+            h_align='right',
+            v_align='center',
+        )
+
+        # These are the same for every row so calc them just once.
+        self._achievements = achievements
+        self._incr = incr
+        self._outline_texture = bui.gettexture('achievementOutline')
+        self._row_y = sub_height - 20
+        self._num_x = sub_width * 0.08 - 5
+        self._icon_x_complete = sub_width * 0.10 + 1
+        self._icon_x_incomplete = sub_width * 0.10 - 4
+        self._name_x = sub_width * 0.19
+        self._pts_x = sub_width * 0.92
+        self._name_maxwidth = sub_width * 0.62
+        self._pts_maxwidth = sub_width * 0.15
+
+        # Lots of achievements share point values; reuse those Lstrs.
+        self._pts_lstrs: dict[int, bui.Lstr] = {}
+
+        # Build enough rows to fill the initial view immediately and
+        # stream in the rest over the next few cycles.
+        self._next_row = 0
+        self._add_rows(self._INITIAL_ROWS)
+
+        bui.textwidget(
+            edit=self._title_text,
+            text=bui.Lstr(
+                resource='accountSettingsWindow.achievementProgressText',
+                subs=[
+                    ('${COUNT}', str(num_complete)),
+                    ('${TOTAL}', str(len(achievements))),
+                ],
+            ),
+        )
+
+    def _add_rows(self, count: int) -> None:
+        # pylint: disable=too-many-locals
+        subcontainer = self._subcontainer
+        if not subcontainer:
+            return
+        textwidget = bui.textwidget
+        imagewidget = bui.imagewidget
+        incr = self._incr
+        row_y = self._row_y
+        num_x = self._num_x
+        icon_x_complete = self._icon_x_complete
+        icon_x_incomplete = self._icon_x_incomplete
+        name_x = self._name_x
+        pts_x = self._pts_x
+        name_maxwidth = self._name_maxwidth
+        pts_maxwidth = self._pts_maxwidth
+        pts_lstrs = self._pts_lstrs
+        pts_rsrc = 'coopSelectWindow.powerRankingPointsText'
+
+        achievements = self._achievements
+        first = self._next_row
+        last = min(first + count, len(achievements))
+        for i in range(first, last):
+            ach = achievements[i]
             complete = ach.complete
-            bui.textwidget(
-                parent=self._subcontainer,
-                position=(sub_width * 0.08 - 5, sub_height - 20 - incr * i),
+            y = row_y - incr * i
+            textwidget(
+                parent=subcontainer,
+                position=(num_x, y),
                 maxwidth=20,
                 scale=0.5,
                 color=(0.6, 0.6, 0.7) if complete else (0.6, 0.6, 0.7, 0.2),
@@ -122,31 +201,28 @@ class AchievementsWindow(PopupWindow):
                 v_align='center',
             )
 
-            bui.imagewidget(
-                parent=self._subcontainer,
-                position=(sub_width * 0.10 + 1, sub_height - 20 - incr * i - 9)
+            imagewidget(
+                parent=subcontainer,
+                position=(icon_x_complete, y - 9)
                 if complete
-                else (sub_width * 0.10 - 4, sub_height - 20 - incr * i - 14),
+                else (icon_x_incomplete, y - 14),
                 size=(18, 18) if complete else (27, 27),
                 opacity=1.0 if complete else 0.3,
                 color=ach.get_icon_color(complete)[:3],
                 texture=ach.get_icon_ui_texture(complete),
             )
             if complete:
-                bui.imagewidget(
-                    parent=self._subcontainer,
-                    position=(
-                        sub_width * 0.10 - 4,
-                        sub_height - 25 - incr * i - 9,
-                    ),
+                imagewidget(
+                    parent=subcontainer,
+                    position=(icon_x_incomplete, y - 14),
                     size=(28, 28),
                     color=(2, 1.4, 0),
-                    texture=bui.gettexture('achievementOutline'),
+                    texture=self._outline_texture,
                 )
-            bui.textwidget(
-                parent=self._subcontainer,
-                position=(sub_width * 0.19, sub_height - 19 - incr * i + 3),
-                maxwidth=sub_width * 0.62,
+            textwidget(
+                parent=subcontainer,
+                position=(name_x, y + 4),
+                maxwidth=name_maxwidth,
                 scale=0.6,
                 flatness=1.0,
                 shadow=0.0,
@@ -157,10 +233,10 @@ class AchievementsWindow(PopupWindow):
                 v_align='center',
             )
 
-            bui.textwidget(
-                parent=self._subcontainer,
-                position=(sub_width * 0.19, sub_height - 19 - incr * i - 10),
-                maxwidth=sub_width * 0.62,
+            textwidget(
+                parent=subcontainer,
+                position=(name_x, y - 9),
+                maxwidth=name_maxwidth,
                 scale=0.4,
                 flatness=1.0,
                 shadow=0.0,
@@ -174,52 +250,28 @@ class AchievementsWindow(PopupWindow):
             )
 
             pts = ach.power_ranking_value
-            bui.textwidget(
-                parent=self._subcontainer,
-                position=(sub_width * 0.92, sub_height - 20 - incr * i),
-                maxwidth=sub_width * 0.15,
+            pts_lstr = pts_lstrs.get(pts)
+            if pts_lstr is None:
+                pts_lstr = pts_lstrs[pts] = bui.Lstr(
+                    resource=pts_rsrc, subs=[('${NUMBER}', str(pts))]
+                )
+            textwidget(
+                parent=subcontainer,
+                position=(pts_x, y),
+                maxwidth=pts_maxwidth,
                 color=(0.7, 0.8, 1.0) if complete else (0.9, 0.9, 1.0, 0.3),
                 flatness=1.0,
                 shadow=0.0,
                 scale=0.6,
-                text=bui.Lstr(
-                    resource=pts_rsrc, subs=[('${NUMBER}', str(pts))]
-                ),
+                text=pts_lstr,
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
             )
-            if complete:
-                total_pts += pts
 
-        bui.textwidget(
-            parent=self._subcontainer,
-            position=(
-                sub_width * 1.0,
-                sub_height - 20 - incr * len(achievements),
-            ),
-            maxwidth=sub_width * 0.5,
-            scale=0.7,
-            color=(0.7, 0.8, 1.0),
-            flatness=1.0,
-            shadow=0.0,
-            text=bui.Lstr(
-                value='${A} ${B}',
-                subs=[
-                    ('${A}', bui.Lstr(resource='coopSelectWindow.totalText')),
-                    (
-                        '${B}',
-                        bui.Lstr(
-                            resource=eq_rsrc,
-                            subs=[('${NUMBER}', str(total_pts))],
-                        ),
-                    ),
-                ],
-            ),
-            size=(0, 0),
-            h_align='right',
-            v_align='center',
-        )
+        self._next_row = last
+        if last < len(achievements):
+            bui.pushcall(bui.WeakCall(self._add_rows, self._ROWS_PER_BATCH))
 
     def _on_cancel_press(self) -> None:
         self._transition_out()
@@ -12,10 +12,46 @@ import bauiv1 as bui
 if TYPE_CHECKING:
     from typing import Any, Callable
 
+# Window scale for each ui-scale.
+_UISCALE_TO_SCALE = {
+    bui.UIScale.SMALL: 2.1,
+    bui.UIScale.MEDIUM: 1.5,
+    bui.UIScale.LARGE: 1.0,
+}
+
+
+# Which resource our quit prompt uses; resolved on first use.
+_g_quit_resource: str | None = None
+
+
+def _get_quit_resource() -> str:
+    global _g_quit_resource  # pylint: disable=global-statement
+
+    if _g_quit_resource is None:
+        classic = bui.app.classic
+        if classic is None:
+            if bui.do_once():
+                logging.warning(
+                    'QuitWindow needs to be updated to work without classic.'
+                )
+            # Don't store this; classic may still show up later.
+            return 'exitGameText'
+        _g_quit_resource = (
+            'quitGameText' if classic.platform == 'mac' else 'exitGameText'
+        )
+    return _g_quit_resource
+
 
 class ConfirmWindow:
     """Window for answering simple yes/no questions."""
 
+    __slots__ = (
+        '_action',
+        '_ok_transition',
+        '_cancel_transition',
+        'root_widget',
+    )
+
     def __init__(
         self,
         text: str | bui.Lstr = 'Are you sure?',
@@ -32,45 +68,44 @@ class ConfirmWindow:
     ):
         # pylint: disable=too-many-locals
         if ok_text is None:
-            ok_text = bui.Lstr(resource='okText')
+            ok_text = bui.shared_lstr('okText')
         if cancel_text is None:
-            cancel_text = bui.Lstr(resource='cancelText')
+            cancel_text = bui.shared_lstr('cancelText')
         height += 40
         width = max(width, 360)
+        half_width = width * 0.5
+        text_max_height = height - 75
         self._action = action
 
         # if they provided an origin-widget, scale up from that
-        self._transition_out: str | None
         scale_origin: tuple[float, float] | None
         if origin_widget is not None:
-            self._transition_out = 'out_scale'
+            self._ok_transition = self._cancel_transition = 'out_scale'
             scale_origin = origin_widget.get_screen_space_center()
             transition = 'in_scale'
         else:
-            self._transition_out = None
+            self._ok_transition = 'out_left'
+            self._cancel_transition = 'out_right'
             scale_origin = None
             transition = 'in_right'
 
-        assert bui.app.classic is not None
-        uiscale = bui.app.classic.ui.uiscale
-        self.root_widget = bui.containerwidget(
+        containerwidget = bui.containerwidget
+        buttonwidget = bui.buttonwidget
+        classic = bui.app.classic
+        assert classic is not None
+        overlay_stack = bui.get_special_widget('overlay_stack')
+        root_widget = self.root_widget = containerwidget(
             size=(width, height),
             transition=transition,
             toolbar_visibility='menu_minimal_no_back',
-            parent=bui.get_special_widget('overlay_stack'),
-            scale=(
-                2.1
-                if uiscale is bui.UIScale.SMALL
-                else 1.5
-                if uiscale is bui.UIScale.MEDIUM
-                else 1.0
-            ),
+            parent=overlay_stack,
+            scale=_UISCALE_TO_SCALE[classic.ui.uiscale],
             scale_origin_stack_offset=scale_origin,
         )
 
         bui.textwidget(
-            parent=self.root_widget,
-            position=(width * 0.5, height - 5 - (height - 75) * 0.5),
+            parent=root_widget,
+            position=(half_width, height - 5 - text_max_height * 0.5),
             size=(0, 0),
             h_align='center',
             v_align='center',
@@ -78,29 +113,28 @@ class ConfirmWindow:
             scale=text_scale,
             color=color,
             maxwidth=width * 0.9,
-            max_height=height - 75,
+            max_height=text_max_height,
         )
 
         cbtn: bui.Widget | None
         if cancel_button:
-            cbtn = btn = bui.buttonwidget(
-                parent=self.root_widget,
+            cbtn = buttonwidget(
+                parent=root_widget,
                 autoselect=True,
                 position=(20, 20),
                 size=(150, 50),
                 label=cancel_text,
                 on_activate_call=self._cancel,
             )
-            bui.containerwidget(edit=self.root_widget, cancel_button=btn)
             ok_button_h = width - 175
         else:
             # if they don't want a cancel button, we still want back presses to
             # be able to dismiss the window; just wire it up to do the ok
             # button
-            ok_button_h = width * 0.5 - 75
+            ok_button_h = half_width - 75
             cbtn = None
-        btn = bui.buttonwidget(
-            parent=self.root_widget,
+        btn = buttonwidget(
+            parent=root_widget,
             autoselect=True,
             position=(ok_button_h, 20),
             size=(150, 50),
@@ -108,15 +142,13 @@ class ConfirmWindow:
             on_activate_call=self._ok,
         )
 
-        # if they didn't want a cancel button, we still want to be able to hit
-        # cancel/back/etc to dismiss the window
-        if not cancel_button:
-            bui.containerwidget(
-                edit=self.root_widget, on_cancel_call=btn.activate
-            )
-
-        bui.containerwidget(
-            edit=self.root_widget,
+        # If they didn't want a cancel button, we still want to be able to
+        # hit cancel/back/etc to dismiss the window. (Note that None values
+        # are simply ignored here so we can do all our edits at once).
+        containerwidget(
+            edit=root_widget,
+            cancel_button=cbtn,
+            on_cancel_call=None if cancel_button else btn.activate,
             selected_child=(
                 cbtn if cbtn is not None and cancel_is_selected else btn
             ),
@@ -125,24 +157,14 @@ class ConfirmWindow:
 
     def _cancel(self) -> None:
         bui.containerwidget(
-            edit=self.root_widget,
-            transition=(
-                'out_right'
-                if self._transition_out is None
-                else self._transition_out
-            ),
+            edit=self.root_widget, transition=self._cancel_transition
         )
 
     def _ok(self) -> None:
         if not self.root_widget:
             return
         bui.containerwidget(
-            edit=self.root_widget,
-            transition=(
-                'out_left'
-                if self._transition_out is None
-                else self._transition_out
-            ),
+            edit=self.root_widget, transition=self._ok_transition
         )
         if self._action is not None:
             self._action()
@@ -151,6 +173,8 @@ class ConfirmWindow:
 class QuitWindow:
     """Popup window to confirm quitting."""
 
+    __slots__ = ('_back', '_root_widget')
+
     def __init__(
         self,
         swish: bool = False,
@@ -159,7 +183,6 @@ class QuitWindow:
     ):
         assert bui.app.classic is not None
         ui = bui.app.classic.ui
-        app = bui.app
         self._back = back
 
         # If there's already one of us up somewhere, kill it.
@@ -169,22 +192,10 @@ class QuitWindow:
         if swish:
             bui.getsound('swish').play()
 
-        if app.classic is None:
-            if bui.do_once():
-                logging.warning(
-                    'QuitWindow needs to be updated to work without classic.'
-                )
-            quit_resource = 'exitGameText'
-        else:
-            quit_resource = (
-                'quitGameText'
-                if app.classic.platform == 'mac'
-                else 'exitGameText'
-            )
         self._root_widget = ui.quit_window = ConfirmWindow(
-            bui.Lstr(
-                resource=quit_resource,
-                subs=[('${APP_NAME}', bui.Lstr(resource='titleText'))],
+            bui.shared_lstr(
+                _get_quit_resource(),
+                (('${APP_NAME}', bui.shared_lstr('titleText')),),
             ),
             self._fade_and_quit,
             origin_widget=origin_widget,
@@ -194,7 +205,7 @@ class QuitWindow:
         bui.fade_screen(
             False,
             time=0.2,
-            endcall=lambda: bui.quit(soft=True, back=self._back),
+            endcall=bui.Call(bui.quit, soft=True, back=self._back),
         )
         bui.lock_all_input()
 
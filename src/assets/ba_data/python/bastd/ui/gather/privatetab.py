@@ -5,11 +5,10 @@
 from __future__ import annotations
 
 import os
-import copy
 import time
 import logging
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple, replace
 from typing import TYPE_CHECKING, cast
 
 from efro.dataclassio import dataclass_from_dict, dataclass_to_dict
@@ -19,7 +18,6 @@ from bacommon.net import (
     PrivatePartyConnectResult,
 )
 from bastd.ui.gather import GatherTab
-from bastd.ui.getcurrency import GetCurrencyWindow, show_get_tickets_prompt
 import bascenev1 as bs
 import bauiv1 as bui
 
@@ -28,11 +26,17 @@ if TYPE_CHECKING:
 
     from bastd.ui.gather import GatherWindow
 
-
 # Print a bit of info about queries, etc.
 DEBUG_SERVER_COMMUNICATION = os.environ.get('BA_DEBUG_PPTABCOM') == '1'
 
 
+# Session types we can host, by their config name.
+_SESSION_TYPES: dict[str, type[bs.Session]] = {
+    'ffa': bs.FreeForAllSession,
+    'teams': bs.DualTeamSession,
+}
+
+
 class SubTabType(Enum):
     """Available sub-tabs."""
 
@@ -40,7 +44,48 @@ class SubTabType(Enum):
     HOST = 'host'
 
 
-@dataclass
+class _HostButtonState(Enum):
+    """What our host start/stop button is currently offering."""
+
+    LOADING = 'loading'
+    WAITING = 'waiting'
+    UNAVAILABLE = 'unavailable'
+    START = 'start'
+    START_PAID = 'start_paid'
+    STOP = 'stop'
+
+
+# Label resource, color, and text color for each host button state.
+_HOST_BUTTON_STYLES: dict[
+    _HostButtonState,
+    tuple[
+        str,
+        tuple[float, float, float] | None,
+        tuple[float, float, float] | None,
+    ],
+] = {
+    _HostButtonState.LOADING: (
+        'oneMomentText',
+        (0.6, 0.6, 0.6),
+        (0.7, 0.7, 0.7),
+    ),
+    _HostButtonState.WAITING: ('oneMomentText', (0.5, 1.0, 0.5), None),
+    _HostButtonState.UNAVAILABLE: (
+        'gatherWindow.hostingUnavailableText',
+        (0.6, 0.6, 0.6),
+        (0.7, 0.7, 0.7),
+    ),
+    _HostButtonState.START: ('gatherWindow.startHostingText', None, None),
+    _HostButtonState.START_PAID: (
+        'gatherWindow.startHostingPaidText',
+        None,
+        None,
+    ),
+    _HostButtonState.STOP: ('gatherWindow.stopHostingText', None, None),
+}
+
+
+@dataclass(slots=True)
 class State:
     """Our core state that persists while the app is running."""
 
@@ -58,22 +103,42 @@ class PrivateGatherTab(GatherTab):
         self._join_sub_tab_text: bui.Widget | None = None
         self._host_sub_tab_text: bui.Widget | None = None
         self._update_timer: bui.AppTimer | None = None
+        self._state_query_timer: bui.AppTimer | None = None
         self._join_party_code_text: bui.Widget | None = None
         self._c_width: float = 0.0
         self._c_height: float = 0.0
-        self._last_hosting_state_query_time: float | None = None
         self._waiting_for_initial_state = True
         self._waiting_for_start_stop_response = True
         self._host_playlist_button: bui.Widget | None = None
         self._host_copy_button: bui.Widget | None = None
         self._host_connect_button: bui.Widget | None = None
         self._host_start_stop_button: bui.Widget | None = None
+        self._last_host_button_key: tuple | None = None
         self._get_tickets_button: bui.Widget | None = None
         self._ticket_count_text: bui.Widget | None = None
+        self._ticket_prefix = bui.charstr(bui.SpecialChar.TICKET)
+        self._last_ticket_str: str | None = None
         self._showing_not_signed_in_screen = False
+        self._last_render_key: tuple | None = None
+        self._sub_tab_widgets: list[bui.Widget] = []
+        self._refresh_pending = False
         self._create_time = time.time()
+        self._click_sound = bui.getsound('click01')
+        self._error_sound = bui.getsound('error')
         self._last_action_send_time: float | None = None
-        self._connect_press_time: float | None = None
+        self._connect_debounce_until = 0.0
+
+        # Reusable weak callbacks for our timers and server transactions.
+        self._update_call = bui.WeakCall(self._update)
+        self._query_call = bui.WeakCall(self._query_hosting_state)
+        self._idle_response_call = bui.WeakCall(
+            self._hosting_state_idle_response
+        )
+        self._response_call = bui.WeakCall(self._hosting_state_response)
+        self._connect_response_call = bui.WeakCall(self._connect_response)
+        self._hostingconfig_dict: tuple[
+            PrivateHostingConfig, dict[str, Any]
+        ] | None = None
         try:
             self._hostingconfig = self._build_hosting_config()
         except Exception:
@@ -148,18 +213,21 @@ class PrivateGatherTab(GatherTab):
             edit=self._join_sub_tab_text, right_widget=self._host_sub_tab_text
         )
 
-        self._update_timer = bui.AppTimer(
-            1.0, bui.WeakCall(self._update), repeat=True
-        )
+        # Ticket counts and sign-in state get checked every few seconds;
+        # hosting state only needs to be queried occasionally.
+        self._update_timer = bui.AppTimer(2.0, self._update_call, repeat=True)
 
         # Prevent taking any action until we've updated our state.
         self._waiting_for_initial_state = True
 
-        # This will get a state query sent out immediately.
         self._last_action_send_time = None  # Ensure we don't ignore response.
-        self._last_hosting_state_query_time = None
         self._update()
+        self._restart_state_queries()
 
+        # Our container is fresh so there's nothing rendered in it yet.
+        self._last_render_key = None
+        self._last_host_button_key = None
+        self._sub_tab_widgets.clear()
         self._set_sub_tab(self._state.sub_tab)
 
         return self._container
@@ -177,12 +245,8 @@ class PrivateGatherTab(GatherTab):
             raise RuntimeError(f'Invalid sessiontype {sessiontypestr}')
         hcfg.session_type = sessiontypestr
 
-        sessiontype: type[bs.Session]
-        if hcfg.session_type == 'ffa':
-            sessiontype = bs.FreeForAllSession
-        elif hcfg.session_type == 'teams':
-            sessiontype = bs.DualTeamSession
-        else:
+        sessiontype = _SESSION_TYPES.get(hcfg.session_type)
+        if sessiontype is None:
             raise RuntimeError(f'Invalid sessiontype: {hcfg.session_type}')
         pvars = PlaylistTypeVars(sessiontype)
 
@@ -209,15 +273,11 @@ class PrivateGatherTab(GatherTab):
             playlist, sessiontype, name=playlist_name
         )
 
-        randomize = cfg.get(f'{pvars.config_name} Playlist Randomize')
-        if not isinstance(randomize, bool):
-            randomize = False
-        hcfg.randomize = randomize
+        randomize = cfg.get(f'{pvars.config_name} Playlist Randomize', False)
+        hcfg.randomize = randomize if isinstance(randomize, bool) else False
 
-        tutorial = cfg.get('Show Tutorial')
-        if not isinstance(tutorial, bool):
-            tutorial = True
-        hcfg.tutorial = tutorial
+        tutorial = cfg.get('Show Tutorial', True)
+        hcfg.tutorial = tutorial if isinstance(tutorial, bool) else True
 
         if hcfg.session_type == 'teams':
             ctn: list[str] | None = cfg.get('Custom Team Names')
@@ -241,20 +301,30 @@ class PrivateGatherTab(GatherTab):
                     and all(isinstance(x, (list, tuple)) for x in ctc)
                     and all(len(x) == 3 for x in ctc)
                 ):
-                    hcfg.custom_team_colors = (
-                        (ctc[0][0], ctc[0][1], ctc[0][2]),
-                        (ctc[1][0], ctc[1][1], ctc[1][2]),
-                    )
+                    (r0, g0, b0), (r1, g1, b1) = ctc
+                    hcfg.custom_team_colors = ((r0, g0, b0), (r1, g1, b1))
                 else:
                     print(f'Found invalid custom-team-colors data: {ctc}')
 
         return hcfg
 
+    def _hostingconfig_as_dict(self) -> dict[str, Any]:
+        """Return our hosting config as a dict (serialized only once)."""
+        hcfg = self._hostingconfig
+        if self._hostingconfig_dict is None or (
+            self._hostingconfig_dict[0] is not hcfg
+        ):
+            self._hostingconfig_dict = (hcfg, dataclass_to_dict(hcfg))
+        return self._hostingconfig_dict[1]
+
     def on_deactivate(self) -> None:
         self._update_timer = None
+        self._state_query_timer = None
 
     def _update_currency_ui(self) -> None:
         # Keep currency count up to date if applicable.
+        if not self._get_tickets_button and not self._ticket_count_text:
+            return
         plus = bui.app.plus
         assert plus is not None
 
@@ -262,16 +332,17 @@ class PrivateGatherTab(GatherTab):
             t_str = str(plus.get_v1_account_ticket_count())
         except Exception:
             t_str = '?'
+
+        # Nothing to do if our widgets already show this count.
+        if t_str == self._last_ticket_str:
+            return
+        self._last_ticket_str = t_str
+
+        label = self._ticket_prefix + t_str
         if self._get_tickets_button:
-            bui.buttonwidget(
-                edit=self._get_tickets_button,
-                label=bui.charstr(bui.SpecialChar.TICKET) + t_str,
-            )
+            bui.buttonwidget(edit=self._get_tickets_button, label=label)
         if self._ticket_count_text:
-            bui.textwidget(
-                edit=self._ticket_count_text,
-                text=bui.charstr(bui.SpecialChar.TICKET) + t_str,
-            )
+            bui.textwidget(edit=self._ticket_count_text, text=label)
 
     def _update(self) -> None:
         """Periodic updating."""
@@ -279,38 +350,47 @@ class PrivateGatherTab(GatherTab):
         plus = bui.app.plus
         assert plus is not None
 
-        now = bui.apptime()
-
         self._update_currency_ui()
 
-        if self._state.sub_tab is SubTabType.HOST:
-            # If we're not signed in, just refresh to show that.
-            if (
-                plus.get_v1_account_state() != 'signed_in'
-                and self._showing_not_signed_in_screen
-            ):
-                self._refresh_sub_tab()
-            else:
-                # Query an updated state periodically.
-                if (
-                    self._last_hosting_state_query_time is None
-                    or now - self._last_hosting_state_query_time > 15.0
-                ):
-                    self._debug_server_comm('querying private party state')
-                    if plus.get_v1_account_state() == 'signed_in':
-                        plus.add_v1_account_transaction(
-                            {
-                                'type': 'PRIVATE_PARTY_QUERY',
-                                'expire_time': time.time() + 20,
-                            },
-                            callback=bui.WeakCall(
-                                self._hosting_state_idle_response
-                            ),
-                        )
-                        plus.run_v1_account_transactions()
-                    else:
-                        self._hosting_state_idle_response(None)
-                    self._last_hosting_state_query_time = now
+        # Nothing else to do unless we're showing the host sub-tab.
+        if self._state.sub_tab is not SubTabType.HOST:
+            return
+
+        # If we're not signed in, just refresh to show that. (Our query
+        # timer takes care of hosting state queries.)
+        if (
+            plus.get_v1_account_state() != 'signed_in'
+            and self._showing_not_signed_in_screen
+        ):
+            self._request_refresh()
+
+    def _restart_state_queries(self) -> None:
+        """Query hosting state now and then every 15 seconds after."""
+        self._state_query_timer = bui.AppTimer(
+            15.0, self._query_call, repeat=True
+        )
+        self._query_hosting_state()
+
+    def _query_hosting_state(self) -> None:
+        plus = bui.app.plus
+        assert plus is not None
+
+        if self._state.sub_tab is not SubTabType.HOST:
+            return
+
+        if DEBUG_SERVER_COMMUNICATION:
+            self._debug_server_comm('querying private party state')
+        if plus.get_v1_account_state() == 'signed_in':
+            plus.add_v1_account_transaction(
+                {
+                    'type': 'PRIVATE_PARTY_QUERY',
+                    'expire_time': time.time() + 20,
+                },
+                callback=self._idle_response_call,
+            )
+            plus.run_v1_account_transactions()
+        else:
+            self._hosting_state_idle_response(None)
 
     def _hosting_state_idle_response(
         self, result: dict[str, Any] | None
@@ -323,11 +403,13 @@ class PrivateGatherTab(GatherTab):
         # takes effect, etc.)
         if (
             self._last_action_send_time is not None
-            and time.time() - self._last_action_send_time < 5.0
+            and time.monotonic() - self._last_action_send_time < 5.0
         ):
-            self._debug_server_comm(
-                'ignoring private party state response due to recent action'
-            )
+            if DEBUG_SERVER_COMMUNICATION:
+                self._debug_server_comm(
+                    'ignoring private party state response'
+                    ' due to recent action'
+                )
             return
         self._hosting_state_response(result)
 
@@ -339,14 +421,15 @@ class PrivateGatherTab(GatherTab):
 
         state: PrivateHostingState | None = None
         if result is not None:
-            self._debug_server_comm('got private party state response')
+            if DEBUG_SERVER_COMMUNICATION:
+                self._debug_server_comm('got private party state response')
             try:
                 state = dataclass_from_dict(
                     PrivateHostingState, result, discard_unknown_attrs=True
                 )
             except Exception:
                 logging.exception('Got invalid PrivateHostingState data')
-        else:
+        elif DEBUG_SERVER_COMMUNICATION:
             self._debug_server_comm('private party state response errored')
 
         # Hmm I guess let's just ignore failed responses?...
@@ -354,27 +437,36 @@ class PrivateGatherTab(GatherTab):
         if result is None or state is None:
             return
 
+        # Most idle polls come back with exactly what we're showing.
+        unchanged = (
+            state == self._hostingstate
+            and not self._waiting_for_initial_state
+            and not self._waiting_for_start_stop_response
+        )
         self._waiting_for_initial_state = False
         self._waiting_for_start_stop_response = False
+        if unchanged:
+            return
         self._hostingstate = state
-        self._refresh_sub_tab()
+        self._request_refresh()
 
     def _set_sub_tab(self, value: SubTabType, playsound: bool = False) -> None:
         assert self._container
         if playsound:
-            bui.getsound('click01').play()
+            self._click_sound.play()
 
         # If switching from join to host, do a fresh state query.
-        if self._state.sub_tab is SubTabType.JOIN and value is SubTabType.HOST:
+        to_host = (
+            self._state.sub_tab is SubTabType.JOIN and value is SubTabType.HOST
+        )
+        if to_host:
             # Prevent taking any action until we've gotten a fresh state.
             self._waiting_for_initial_state = True
-
-            # This will get a state query sent out immediately.
-            self._last_hosting_state_query_time = None
             self._last_action_send_time = None  # So we don't ignore response.
-            self._update()
 
         self._state.sub_tab = value
+        if to_host:
+            self._restart_state_queries()
         active_color = (0.6, 1.0, 0.6)
         inactive_color = (0.5, 0.4, 0.5)
         bui.textwidget(
@@ -401,8 +493,39 @@ class PrivateGatherTab(GatherTab):
             self._get_tickets_button,
         ]
 
+    def _request_refresh(self) -> None:
+        """Refresh our sub-tab on the next cycle.
+
+        Any further requests before then get folded into that one.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        bui.pushcall(bui.WeakCall(self._do_pending_refresh))
+
+    def _do_pending_refresh(self) -> None:
+        self._refresh_pending = False
+        if self._container:
+            self._refresh_sub_tab()
+
     def _refresh_sub_tab(self) -> None:
         assert self._container
+        plus = bui.app.plus
+        assert plus is not None
+
+        # Skip the rebuild if nothing we display has changed since the
+        # last one (idle state polls usually come back identical).
+        render_key = (
+            self._state.sub_tab,
+            astuple(self._hostingstate),
+            self._hostingconfig.playlist_name,
+            self._waiting_for_initial_state,
+            self._waiting_for_start_stop_response,
+            plus.get_v1_account_state(),
+        )
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
 
         # Store an index for our current selection so we can
         # reselect the equivalent recreated widget if possible.
@@ -415,16 +538,16 @@ class PrivateGatherTab(GatherTab):
                 pass
 
         # Clear anything existing in the old sub-tab.
-        for widget in self._container.get_children():
-            if widget and widget not in {
-                self._host_sub_tab_text,
-                self._join_sub_tab_text,
-            }:
+        for widget in self._sub_tab_widgets:
+            if widget:
                 widget.delete()
+        self._sub_tab_widgets.clear()
 
-        if self._state.sub_tab is SubTabType.JOIN:
+        sub_tab = self._state.sub_tab
+        if sub_tab is SubTabType.JOIN:
+            self._clear_host_button()
             self._build_join_tab()
-        elif self._state.sub_tab is SubTabType.HOST:
+        elif sub_tab is SubTabType.HOST:
             self._build_host_tab()
         else:
             raise RuntimeError('Invalid state.')
@@ -437,9 +560,20 @@ class PrivateGatherTab(GatherTab):
                     edit=self._container, selected_child=selwidget
                 )
 
+    def _add_text(self, **kwargs: Any) -> bui.Widget:
+        """Create a textwidget to be cleared on our next sub-tab refresh."""
+        widget = bui.textwidget(parent=self._container, **kwargs)
+        self._sub_tab_widgets.append(widget)
+        return widget
+
+    def _add_button(self, **kwargs: Any) -> bui.Widget:
+        """Create a buttonwidget to be cleared on our next sub-tab refresh."""
+        widget = bui.buttonwidget(parent=self._container, **kwargs)
+        self._sub_tab_widgets.append(widget)
+        return widget
+
     def _build_join_tab(self) -> None:
-        bui.textwidget(
-            parent=self._container,
+        self._add_text(
             position=(self._c_width * 0.5, self._c_height - 140),
             color=(0.5, 0.46, 0.5),
             scale=1.5,
@@ -447,27 +581,25 @@ class PrivateGatherTab(GatherTab):
             maxwidth=250,
             h_align='center',
             v_align='center',
-            text=bui.Lstr(resource='gatherWindow.partyCodeText'),
+            text=bui.shared_lstr('gatherWindow.partyCodeText'),
         )
 
-        self._join_party_code_text = bui.textwidget(
-            parent=self._container,
+        self._join_party_code_text = self._add_text(
             position=(self._c_width * 0.5 - 150, self._c_height - 250),
             flatness=1.0,
             scale=1.5,
             size=(300, 50),
             editable=True,
-            description=bui.Lstr(resource='gatherWindow.partyCodeText'),
+            description=bui.shared_lstr('gatherWindow.partyCodeText'),
             autoselect=True,
             maxwidth=250,
             h_align='left',
             v_align='center',
             text='',
         )
-        btn = bui.buttonwidget(
-            parent=self._container,
+        btn = self._add_button(
             size=(300, 70),
-            label=bui.Lstr(resource='gatherWindow.' 'manualConnectText'),
+            label=bui.shared_lstr('gatherWindow.manualConnectText'),
             position=(self._c_width * 0.5 - 150, self._c_height - 350),
             on_activate_call=self._join_connect_press,
             autoselect=True,
@@ -477,6 +609,8 @@ class PrivateGatherTab(GatherTab):
         )
 
     def _on_get_tickets_press(self) -> None:
+        from bastd.ui.getcurrency import GetCurrencyWindow
+
         if self._waiting_for_start_stop_response:
             return
 
@@ -487,25 +621,52 @@ class PrivateGatherTab(GatherTab):
     def _build_host_tab(self) -> None:
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-statements
-        assert bui.app.classic is not None
+        # pylint: disable=too-many-locals
+        classic = bui.app.classic
+        assert classic is not None
+        uisubsystem = classic.ui
 
         plus = bui.app.plus
         assert plus is not None
 
         hostingstate = self._hostingstate
+        container = self._container
+        textwidget = self._add_text
+        c_width = self._c_width
+        c_height = self._c_height
+        c_width_half = c_width * 0.5
+        c_width_90 = c_width * 0.9
+
+        def centered_text(
+            ypos: float,
+            text: str | bui.Lstr,
+            color: tuple[float, float, float],
+        ) -> None:
+            textwidget(
+                size=(0, 0),
+                h_align='center',
+                v_align='center',
+                maxwidth=c_width_90,
+                scale=0.7,
+                flatness=1.0,
+                color=color,
+                position=(c_width_half, ypos),
+                text=text,
+            )
+
         if plus.get_v1_account_state() != 'signed_in':
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
                 maxwidth=200,
                 scale=0.8,
                 color=(0.6, 0.56, 0.6),
-                position=(self._c_width * 0.5, self._c_height * 0.5),
-                text=bui.Lstr(resource='notSignedInErrorText'),
+                position=(c_width_half, c_height * 0.5),
+                text=bui.shared_lstr('notSignedInErrorText'),
             )
             self._showing_not_signed_in_screen = True
+            self._clear_host_button()
             return
         self._showing_not_signed_in_screen = False
 
@@ -516,18 +677,17 @@ class PrivateGatherTab(GatherTab):
         # playlists/etc without having to wait for the server each time
         # back to the ui.
         if self._waiting_for_initial_state and bool(False):
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
                 maxwidth=200,
                 scale=0.8,
                 color=(0.6, 0.56, 0.6),
-                position=(self._c_width * 0.5, self._c_height * 0.5),
+                position=(c_width_half, c_height * 0.5),
                 text=bui.Lstr(
                     value='${A}...',
-                    subs=[('${A}', bui.Lstr(resource='store.loadingText'))],
+                    subs=[('${A}', bui.shared_lstr('store.loadingText'))],
                 ),
             )
             return
@@ -539,146 +699,131 @@ class PrivateGatherTab(GatherTab):
             and hostingstate.party_code is None
             and hostingstate.tickets_to_host_now != 0
         ):
-            if not bui.app.classic.ui.use_toolbars:
-                if bui.app.classic.allow_ticket_purchases:
-                    self._get_tickets_button = bui.buttonwidget(
-                        parent=self._container,
+            if not uisubsystem.use_toolbars:
+                if classic.allow_ticket_purchases:
+                    self._get_tickets_button = self._add_button(
                         position=(
-                            self._c_width - 210 + 125,
-                            self._c_height - 44,
+                            c_width - 210 + 125,
+                            c_height - 44,
                         ),
                         autoselect=True,
                         scale=0.6,
                         size=(120, 60),
                         textcolor=(0.2, 1, 0.2),
-                        label=bui.charstr(bui.SpecialChar.TICKET),
+                        label=self._ticket_prefix,
                         color=(0.65, 0.5, 0.8),
                         on_activate_call=self._on_get_tickets_press,
                     )
                 else:
-                    self._ticket_count_text = bui.textwidget(
-                        parent=self._container,
+                    self._ticket_count_text = textwidget(
                         scale=0.6,
                         position=(
-                            self._c_width - 210 + 125,
-                            self._c_height - 44,
+                            c_width - 210 + 125,
+                            c_height - 44,
                         ),
                         color=(0.2, 1, 0.2),
                         h_align='center',
                         v_align='center',
                     )
-                # Set initial ticket count.
+                # Set initial ticket count on our fresh widgets.
+                self._last_ticket_str = None
                 self._update_currency_ui()
 
-        v = self._c_height - 90
+        v = c_height - 90
         if hostingstate.party_code is None:
-            bui.textwidget(
-                parent=self._container,
-                size=(0, 0),
-                h_align='center',
-                v_align='center',
-                maxwidth=self._c_width * 0.9,
-                scale=0.7,
-                flatness=1.0,
-                color=(0.5, 0.46, 0.5),
-                position=(self._c_width * 0.5, v),
-                text=bui.Lstr(
-                    resource='gatherWindow.privatePartyCloudDescriptionText'
+            centered_text(
+                v,
+                bui.shared_lstr(
+                    'gatherWindow.privatePartyCloudDescriptionText'
                 ),
+                (0.5, 0.46, 0.5),
             )
 
         v -= 100
         if hostingstate.party_code is None:
             # We've got no current party running; show options to set one up.
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='right',
                 v_align='center',
                 maxwidth=200,
                 scale=0.8,
                 color=(0.6, 0.56, 0.6),
-                position=(self._c_width * 0.5 - 210, v),
-                text=bui.Lstr(resource='playlistText'),
+                position=(c_width_half - 210, v),
+                text=bui.shared_lstr('playlistText'),
             )
-            self._host_playlist_button = bui.buttonwidget(
-                parent=self._container,
+            self._host_playlist_button = self._add_button(
                 size=(400, 70),
                 color=(0.6, 0.5, 0.6),
                 textcolor=(0.8, 0.75, 0.8),
                 label=self._hostingconfig.playlist_name,
                 on_activate_call=self._playlist_press,
-                position=(self._c_width * 0.5 - 200, v - 35),
+                position=(c_width_half - 200, v - 35),
                 up_widget=self._host_sub_tab_text,
                 autoselect=True,
             )
 
             # If it appears we're coming back from playlist selection,
             # re-select our playlist button.
-            if bui.app.classic.ui.selecting_private_party_playlist:
+            if uisubsystem.selecting_private_party_playlist:
                 bui.containerwidget(
-                    edit=self._container,
+                    edit=container,
                     selected_child=self._host_playlist_button,
                 )
-                bui.app.classic.ui.selecting_private_party_playlist = False
+                uisubsystem.selecting_private_party_playlist = False
         else:
             # We've got a current party; show its info.
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
                 maxwidth=600,
                 scale=0.9,
                 color=(0.7, 0.64, 0.7),
-                position=(self._c_width * 0.5, v + 90),
-                text=bui.Lstr(resource='gatherWindow.partyServerRunningText'),
+                position=(c_width_half, v + 90),
+                text=bui.shared_lstr('gatherWindow.partyServerRunningText'),
             )
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
                 maxwidth=600,
                 scale=0.7,
                 color=(0.7, 0.64, 0.7),
-                position=(self._c_width * 0.5, v + 50),
-                text=bui.Lstr(resource='gatherWindow.partyCodeText'),
+                position=(c_width_half, v + 50),
+                text=bui.shared_lstr('gatherWindow.partyCodeText'),
             )
-            bui.textwidget(
-                parent=self._container,
+            textwidget(
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
                 scale=2.0,
                 color=(0.0, 1.0, 0.0),
-                position=(self._c_width * 0.5, v + 10),
+                position=(c_width_half, v + 10),
                 text=hostingstate.party_code,
             )
 
             # Also action buttons to copy it and connect to it.
             if bui.clipboard_is_supported():
                 cbtnoffs = 10
-                self._host_copy_button = bui.buttonwidget(
-                    parent=self._container,
+                self._host_copy_button = self._add_button(
                     size=(140, 40),
                     color=(0.6, 0.5, 0.6),
                     textcolor=(0.8, 0.75, 0.8),
-                    label=bui.Lstr(resource='gatherWindow.copyCodeText'),
+                    label=bui.shared_lstr('gatherWindow.copyCodeText'),
                     on_activate_call=self._host_copy_press,
-                    position=(self._c_width * 0.5 - 150, v - 70),
+                    position=(c_width_half - 150, v - 70),
                     autoselect=True,
                 )
             else:
                 cbtnoffs = -70
-            self._host_connect_button = bui.buttonwidget(
-                parent=self._container,
+            self._host_connect_button = self._add_button(
                 size=(140, 40),
                 color=(0.6, 0.5, 0.6),
                 textcolor=(0.8, 0.75, 0.8),
-                label=bui.Lstr(resource='gatherWindow.manualConnectText'),
+                label=bui.shared_lstr('gatherWindow.manualConnectText'),
                 on_activate_call=self._host_connect_press,
-                position=(self._c_width * 0.5 + cbtnoffs, v - 70),
+                position=(c_width_half + cbtnoffs, v - 70),
                 autoselect=True,
             )
 
@@ -691,40 +836,21 @@ class PrivateGatherTab(GatherTab):
             pass
         elif hostingstate.unavailable_error is not None:
             # If hosting is unavailable, show the associated reason.
-            bui.textwidget(
-                parent=self._container,
-                size=(0, 0),
-                h_align='center',
-                v_align='center',
-                maxwidth=self._c_width * 0.9,
-                scale=0.7,
-                flatness=1.0,
-                color=(1.0, 0.0, 0.0),
-                position=(self._c_width * 0.5, v),
-                text=bui.Lstr(
+            centered_text(
+                v,
+                bui.Lstr(
                     translate=(
                         'serverResponses',
                         hostingstate.unavailable_error,
                     )
                 ),
+                (1.0, 0.0, 0.0),
             )
         elif hostingstate.free_host_minutes_remaining is not None:
             # If we've been pre-approved to start/stop for free, show that.
-            bui.textwidget(
-                parent=self._container,
-                size=(0, 0),
-                h_align='center',
-                v_align='center',
-                maxwidth=self._c_width * 0.9,
-                scale=0.7,
-                flatness=1.0,
-                color=(
-                    (0.7, 0.64, 0.7)
-                    if hostingstate.party_code
-                    else (0.0, 1.0, 0.0)
-                ),
-                position=(self._c_width * 0.5, v),
-                text=bui.Lstr(
+            centered_text(
+                v,
+                bui.Lstr(
                     resource='gatherWindow.startStopHostingMinutesText',
                     subs=[
                         (
@@ -733,115 +859,102 @@ class PrivateGatherTab(GatherTab):
                         )
                     ],
                 ),
+                (
+                    (0.7, 0.64, 0.7)
+                    if hostingstate.party_code
+                    else (0.0, 1.0, 0.0)
+                ),
             )
         else:
             # Otherwise tell whether the free cloud server is available
             # or will be at some point.
             if hostingstate.party_code is None:
                 if hostingstate.tickets_to_host_now == 0:
-                    bui.textwidget(
-                        parent=self._container,
-                        size=(0, 0),
-                        h_align='center',
-                        v_align='center',
-                        maxwidth=self._c_width * 0.9,
-                        scale=0.7,
-                        flatness=1.0,
-                        color=(0.0, 1.0, 0.0),
-                        position=(self._c_width * 0.5, v),
-                        text=bui.Lstr(
-                            resource=(
-                                'gatherWindow.freeCloudServerAvailableNowText'
-                            )
+                    centered_text(
+                        v,
+                        bui.shared_lstr(
+                            'gatherWindow.freeCloudServerAvailableNowText'
                         ),
+                        (0.0, 1.0, 0.0),
                     )
                 else:
                     if hostingstate.minutes_until_free_host is None:
-                        bui.textwidget(
-                            parent=self._container,
-                            size=(0, 0),
-                            h_align='center',
-                            v_align='center',
-                            maxwidth=self._c_width * 0.9,
-                            scale=0.7,
-                            flatness=1.0,
-                            color=(1.0, 0.6, 0.0),
-                            position=(self._c_width * 0.5, v),
-                            text=bui.Lstr(
-                                resource=(
-                                    'gatherWindow'
-                                    '.freeCloudServerNotAvailableText'
-                                )
+                        centered_text(
+                            v,
+                            bui.shared_lstr(
+                                'gatherWindow.freeCloudServerNotAvailableText'
                             ),
+                            (1.0, 0.6, 0.0),
                         )
                     else:
                         availmins = hostingstate.minutes_until_free_host
-                        bui.textwidget(
-                            parent=self._container,
-                            size=(0, 0),
-                            h_align='center',
-                            v_align='center',
-                            maxwidth=self._c_width * 0.9,
-                            scale=0.7,
-                            flatness=1.0,
-                            color=(1.0, 0.6, 0.0),
-                            position=(self._c_width * 0.5, v),
-                            text=bui.Lstr(
+                        centered_text(
+                            v,
+                            bui.Lstr(
                                 resource='gatherWindow.'
                                 'freeCloudServerAvailableMinutesText',
                                 subs=[('${MINUTES}', f'{availmins:.0f}')],
                             ),
+                            (1.0, 0.6, 0.0),
                         )
 
         v -= 100
 
+        unavailable = hostingstate.unavailable_error is not None
         if (
             self._waiting_for_start_stop_response
             or self._waiting_for_initial_state
         ):
-            btnlabel = bui.Lstr(resource='oneMomentText')
+            bstate = (
+                _HostButtonState.LOADING
+                if unavailable or self._waiting_for_initial_state
+                else _HostButtonState.WAITING
+            )
+        elif unavailable:
+            bstate = _HostButtonState.UNAVAILABLE
+        elif hostingstate.party_code is not None:
+            bstate = _HostButtonState.STOP
+        elif hostingstate.tickets_to_host_now > 0:
+            bstate = _HostButtonState.START_PAID
         else:
-            if hostingstate.unavailable_error is not None:
-                btnlabel = bui.Lstr(
-                    resource='gatherWindow.hostingUnavailableText'
-                )
-            elif hostingstate.party_code is None:
-                ticon = bui.charstr(bui.SpecialChar.TICKET)
-                nowtickets = hostingstate.tickets_to_host_now
-                if nowtickets > 0:
-                    btnlabel = bui.Lstr(
-                        resource='gatherWindow.startHostingPaidText',
-                        subs=[('${COST}', f'{ticon}{nowtickets}')],
-                    )
-                else:
-                    btnlabel = bui.Lstr(
-                        resource='gatherWindow.startHostingText'
-                    )
-            else:
-                btnlabel = bui.Lstr(resource='gatherWindow.stopHostingText')
+            bstate = _HostButtonState.START
 
-        disabled = (
-            hostingstate.unavailable_error is not None
-            or self._waiting_for_initial_state
-        )
-        waiting = self._waiting_for_start_stop_response
+        # Our start/stop button survives sub-tab refreshes; only
+        # recreate it if what it shows has changed.
+        nowtickets = hostingstate.tickets_to_host_now
+        button_key = (bstate, nowtickets)
+        if (
+            button_key == self._last_host_button_key
+            and self._host_start_stop_button
+        ):
+            return
+        self._clear_host_button()
+
+        resource, color, textcolor = _HOST_BUTTON_STYLES[bstate]
+        if bstate is _HostButtonState.START_PAID:
+            btnlabel = bui.shared_lstr(
+                resource, (('${COST}', f'{self._ticket_prefix}{nowtickets}'),)
+            )
+        else:
+            btnlabel = bui.shared_lstr(resource)
         self._host_start_stop_button = bui.buttonwidget(
-            parent=self._container,
+            parent=container,
             size=(400, 80),
-            color=(
-                (0.6, 0.6, 0.6)
-                if disabled
-                else (0.5, 1.0, 0.5)
-                if waiting
-                else None
-            ),
+            color=color,
             enable_sound=False,
             label=btnlabel,
-            textcolor=((0.7, 0.7, 0.7) if disabled else None),
-            position=(self._c_width * 0.5 - 200, v),
+            textcolor=textcolor,
+            position=(c_width_half - 200, v),
             on_activate_call=self._start_stop_button_press,
             autoselect=True,
         )
+        self._last_host_button_key = button_key
+
+    def _clear_host_button(self) -> None:
+        if self._host_start_stop_button:
+            self._host_start_stop_button.delete()
+        self._host_start_stop_button = None
+        self._last_host_button_key = None
 
     def _playlist_press(self) -> None:
         assert self._host_playlist_button is not None
@@ -869,16 +982,13 @@ class PrivateGatherTab(GatherTab):
         plus = bui.app.plus
         assert plus is not None
 
-        now = time.time()
-        if (
-            self._connect_press_time is not None
-            and now - self._connect_press_time < 5.0
-        ):
+        now = time.monotonic()
+        if now < self._connect_debounce_until:
             self._debug_server_comm(
                 'not sending private party connect (too soon)'
             )
             return
-        self._connect_press_time = now
+        self._connect_debounce_until = now + 5.0
 
         self._debug_server_comm('sending private party connect')
         plus.add_v1_account_transaction(
@@ -887,11 +997,15 @@ class PrivateGatherTab(GatherTab):
                 'expire_time': time.time() + 20,
                 'code': code,
             },
-            callback=bui.WeakCall(self._connect_response),
+            callback=self._connect_response_call,
         )
-        plus.run_v1_account_transactions()
+
+        # Kick the transaction off after this press handler returns.
+        bui.pushcall(plus.run_v1_account_transactions)
 
     def _start_stop_button_press(self) -> None:
+        from bastd.ui.getcurrency import show_get_tickets_prompt
+
         plus = bui.app.plus
         assert plus is not None
         if (
@@ -902,15 +1016,17 @@ class PrivateGatherTab(GatherTab):
 
         if plus.get_v1_account_state() != 'signed_in':
             bui.screenmessage(bui.Lstr(resource='notSignedInErrorText'))
-            bui.getsound('error').play()
-            self._refresh_sub_tab()
+            self._error_sound.play()
+            self._request_refresh()
             return
 
         if self._hostingstate.unavailable_error is not None:
-            bui.getsound('error').play()
+            self._error_sound.play()
             return
 
-        bui.getsound('click01').play()
+        self._click_sound.play()
+
+        now = time.time()
 
         # If we're not hosting, start.
         if self._hostingstate.party_code is None:
@@ -925,34 +1041,33 @@ class PrivateGatherTab(GatherTab):
                 ticket_cost = self._hostingstate.tickets_to_host_now
                 if ticket_count is not None and ticket_count < ticket_cost:
                     show_get_tickets_prompt()
-                    bui.getsound('error').play()
+                    self._error_sound.play()
                     return
-            self._last_action_send_time = time.time()
+            self._last_action_send_time = time.monotonic()
             plus.add_v1_account_transaction(
                 {
                     'type': 'PRIVATE_PARTY_START',
-                    'config': dataclass_to_dict(self._hostingconfig),
+                    'config': self._hostingconfig_as_dict(),
                     'region_pings': bui.app.net.zone_pings,
-                    'expire_time': time.time() + 20,
+                    'expire_time': now + 20,
                 },
-                callback=bui.WeakCall(self._hosting_state_response),
+                callback=self._response_call,
             )
-            plus.run_v1_account_transactions()
-
         else:
-            self._last_action_send_time = time.time()
+            self._last_action_send_time = time.monotonic()
             plus.add_v1_account_transaction(
                 {
                     'type': 'PRIVATE_PARTY_STOP',
-                    'expire_time': time.time() + 20,
+                    'expire_time': now + 20,
                 },
-                callback=bui.WeakCall(self._hosting_state_response),
+                callback=self._response_call,
             )
-            plus.run_v1_account_transactions()
-        bui.getsound('click01').play()
+
+        # Kick the transaction off after this press handler returns.
+        bui.pushcall(plus.run_v1_account_transactions)
 
         self._waiting_for_start_stop_response = True
-        self._refresh_sub_tab()
+        self._request_refresh()
 
     def _join_connect_press(self) -> None:
         # Error immediately if its an empty code.
@@ -964,14 +1079,14 @@ class PrivateGatherTab(GatherTab):
                 bui.Lstr(resource='internal.invalidAddressErrorText'),
                 color=(1, 0, 0),
             )
-            bui.getsound('error').play()
+            self._error_sound.play()
             return
 
         self._connect_to_party_code(code)
 
     def _connect_response(self, result: dict[str, Any] | None) -> None:
         try:
-            self._connect_press_time = None
+            self._connect_debounce_until = 0.0
             if result is None:
                 raise RuntimeError()
             cresult = dataclass_from_dict(
@@ -983,25 +1098,22 @@ class PrivateGatherTab(GatherTab):
                     bui.Lstr(translate=('serverResponses', cresult.error)),
                     (1, 0, 0),
                 )
-                bui.getsound('error').play()
+                self._error_sound.play()
                 return
             self._debug_server_comm('got valid connect response')
             assert cresult.addr is not None and cresult.port is not None
             bs.connect_to_party(cresult.addr, port=cresult.port)
         except Exception:
             self._debug_server_comm('got connect response error')
-            bui.getsound('error').play()
+            self._error_sound.play()
 
     def save_state(self) -> None:
         assert bui.app.classic is not None
-        bui.app.classic.ui.window_states[type(self)] = copy.deepcopy(
-            self._state
-        )
+        # State only holds immutable values so a shallow copy suffices.
+        bui.app.classic.ui.window_states[self.__class__] = replace(self._state)
 
     def restore_state(self) -> None:
         assert bui.app.classic is not None
-        state = bui.app.classic.ui.window_states.get(type(self))
-        if state is None:
-            state = State()
+        state = bui.app.classic.ui.window_states.get(self.__class__) or State()
         assert isinstance(state, State)
         self._state = state
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 
 import bauiv1 as bui
@@ -11,6 +12,22 @@ import bauiv1 as bui
 if TYPE_CHECKING:
     from typing import Any
 
+# Ticket packs we offer: item, default amount, texture, texture scale,
+# and grid column/row.
+_TICKET_PACKS: tuple[tuple[str, int, str, float, int, int], ...] = (
+    ('tickets2', 500, 'ticketsMore', 1.0, 0, 0),  # 0.99-ish
+    ('tickets3', 1500, 'ticketRoll', 1.0, 1, 0),  # 4.99-ish
+    ('tickets4', 5000, 'ticketRollBig', 1.2, 0, 1),  # 9.99-ish
+    ('tickets5', 15000, 'ticketRolls', 1.2, 1, 1),  # 19.99-ish
+)
+
+
+def _get_next_reward_ad_time() -> datetime.datetime | None:
+    plus = bui.app.plus
+    assert plus is not None
+    val = plus.get_v1_account_misc_read_val_2('nextRewardAdTime', None)
+    return None if val is None else datetime.datetime.utcfromtimestamp(val)
+
 
 class GetCurrencyWindow(bui.Window):
     """Window for purchasing/acquiring currency."""
@@ -36,6 +53,12 @@ class GetCurrencyWindow(bui.Window):
 
         self._ad_button_greyed = False
         self._smooth_update_timer: bui.AppTimer | None = None
+        self._smooth_update_call = bui.WeakCall(self._smooth_update)
+
+        # What our ad countdown and ticket count texts currently show
+        # (so we only edit them when that changes).
+        self._ad_time_secs: int | None = -1
+        self._shown_ticket_count: int | None = None
         self._ad_button = None
         self._ad_label = None
         self._ad_image = None
@@ -121,6 +144,9 @@ class GetCurrencyWindow(bui.Window):
 
         self._ad_button = None
 
+        # Several buttons share textures; only look each up once.
+        textures: dict[str, bui.Texture] = {}
+
         def _add_button(
             item: str,
             position: tuple[float, float],
@@ -181,9 +207,12 @@ class GetCurrencyWindow(bui.Window):
             i = None
             if tex_name is not None:
                 tex_size = 90.0 * tex_scale
+                texture = textures.get(tex_name)
+                if texture is None:
+                    texture = textures[tex_name] = bui.gettexture(tex_name)
                 i = bui.imagewidget(
                     parent=self._root_widget,
-                    texture=bui.gettexture(tex_name),
+                    texture=texture,
                     position=(
                         position[0] + size[0] * 0.5 - tex_size * 0.5,
                         position[1] + size[1] * 0.66 - tex_size * 0.5,
@@ -214,210 +243,69 @@ class GetCurrencyWindow(bui.Window):
                 )
             return btn2
 
+        # Lay out our ticket packs in a 2x2 grid.
+        read_val = plus.get_v1_account_misc_read_val
         rsrc = self._r + '.ticketsText'
-
-        c2txt = bui.Lstr(
-            resource=rsrc,
-            subs=[
-                (
-                    '${COUNT}',
-                    str(
-                        plus.get_v1_account_misc_read_val('tickets2Amount', 500)
-                    ),
-                )
-            ],
-        )
-        c3txt = bui.Lstr(
-            resource=rsrc,
-            subs=[
-                (
-                    '${COUNT}',
-                    str(
-                        plus.get_v1_account_misc_read_val(
-                            'tickets3Amount', 1500
-                        )
-                    ),
-                )
-            ],
-        )
-        c4txt = bui.Lstr(
-            resource=rsrc,
-            subs=[
-                (
-                    '${COUNT}',
-                    str(
-                        plus.get_v1_account_misc_read_val(
-                            'tickets4Amount', 5000
-                        )
-                    ),
-                )
-            ],
-        )
-        c5txt = bui.Lstr(
-            resource=rsrc,
-            subs=[
-                (
-                    '${COUNT}',
-                    str(
-                        plus.get_v1_account_misc_read_val(
-                            'tickets5Amount', 15000
-                        )
-                    ),
-                )
-            ],
-        )
-
         h = 110.0
+        for item, amount, tex_name, tex_scale, col, row in _TICKET_PACKS:
+            price = plus.get_price(item)
+            _add_button(
+                item,
+                enabled=(price is not None),
+                position=(
+                    self._width * 0.5
+                    - spacing * (1.5 - col)
+                    - b_size[0] * (2.0 - col)
+                    + h,
+                    v - row * (b_size[1] - 5),
+                ),
+                size=b_size,
+                label=bui.shared_lstr(
+                    rsrc,
+                    (('${COUNT}', str(read_val(f'{item}Amount', amount))),),
+                ),
+                price=price,
+                tex_name=tex_name,
+                tex_scale=tex_scale,
+            )
 
-        # Enable buttons if we have prices.
-        tickets2_price = plus.get_price('tickets2')
-        tickets3_price = plus.get_price('tickets3')
-        tickets4_price = plus.get_price('tickets4')
-        tickets5_price = plus.get_price('tickets5')
-
-        # TEMP
-        # tickets1_price = '$0.99'
-        # tickets2_price = '$4.99'
-        # tickets3_price = '$9.99'
-        # tickets4_price = '$19.99'
-        # tickets5_price = '$49.99'
-
-        _add_button(
-            'tickets2',
-            enabled=(tickets2_price is not None),
-            position=(
-                self._width * 0.5 - spacing * 1.5 - b_size[0] * 2.0 + h,
-                v,
-            ),
-            size=b_size,
-            label=c2txt,
-            price=tickets2_price,
-            tex_name='ticketsMore',
-        )  # 0.99-ish
-        _add_button(
-            'tickets3',
-            enabled=(tickets3_price is not None),
-            position=(
-                self._width * 0.5 - spacing * 0.5 - b_size[0] * 1.0 + h,
-                v,
-            ),
-            size=b_size,
-            label=c3txt,
-            price=tickets3_price,
-            tex_name='ticketRoll',
-        )  # 4.99-ish
-        v -= b_size[1] - 5
-        _add_button(
-            'tickets4',
-            enabled=(tickets4_price is not None),
-            position=(
-                self._width * 0.5 - spacing * 1.5 - b_size[0] * 2.0 + h,
-                v,
-            ),
-            size=b_size,
-            label=c4txt,
-            price=tickets4_price,
-            tex_name='ticketRollBig',
-            tex_scale=1.2,
-        )  # 9.99-ish
-        _add_button(
-            'tickets5',
-            enabled=(tickets5_price is not None),
-            position=(
-                self._width * 0.5 - spacing * 0.5 - b_size[0] * 1.0 + h,
-                v,
-            ),
-            size=b_size,
-            label=c5txt,
-            price=tickets5_price,
-            tex_name='ticketRolls',
-            tex_scale=1.2,
-        )  # 19.99-ish
-
+        sponsor_tickets = read_val('sponsorTickets', 5)
         self._enable_ad_button = bui.has_video_ads()
         h = self._width * 0.5 + 110.0
         v = self._height - b_size[1] - 115.0
 
+        # Free-ticket options stacked down the right side: item and
+        # label resource.
+        side_buttons: list[tuple[str, str]] = []
         if self._enable_ad_button:
-            h_offs = 35
-            b_size_3 = (150, 120)
-            cdb = _add_button(
-                'ad',
-                position=(h + h_offs, v),
-                size=b_size_3,
-                label=bui.Lstr(
-                    resource=self._r + '.ticketsFromASponsorText',
-                    subs=[
-                        (
-                            '${COUNT}',
-                            str(
-                                plus.get_v1_account_misc_read_val(
-                                    'sponsorTickets', 5
-                                )
-                            ),
-                        )
-                    ],
-                ),
-                tex_name='ticketsMore',
-                enabled=self._enable_ad_button,
-                tex_opacity=0.6,
-                tex_scale=0.7,
-                text_scale=0.7,
-            )
-            bui.buttonwidget(edit=cdb, color=(0.65, 0.5, 0.7))
-
-            self._ad_free_text = bui.textwidget(
-                parent=self._root_widget,
-                text=bui.Lstr(resource=self._r + '.freeText'),
-                position=(
-                    h + h_offs + b_size_3[0] * 0.5,
-                    v + b_size_3[1] * 0.5 + 25,
-                ),
-                size=(0, 0),
-                color=(1, 1, 0, 1.0),
-                draw_controller=cdb,
-                rotate=15,
-                shadow=1.0,
-                maxwidth=150,
-                h_align='center',
-                v_align='center',
-                scale=1.0,
-            )
-            v -= 125
+            side_buttons.append(('ad', self._r + '.ticketsFromASponsorText'))
         else:
             v -= 20
+        side_buttons.append(
+            ('app_invite', 'gatherWindow.earnTicketsForRecommendingText')
+        )
 
-        if True:  # pylint: disable=using-constant-test
-            h_offs = 35
-            b_size_3 = (150, 120)
+        h_offs = 35
+        b_size_3 = (150, 120)
+        free_text = bui.Lstr(resource=self._r + '.freeText')
+        for item, label_resource in side_buttons:
             cdb = _add_button(
-                'app_invite',
+                item,
                 position=(h + h_offs, v),
                 size=b_size_3,
-                label=bui.Lstr(
-                    resource='gatherWindow.earnTicketsForRecommendingText',
-                    subs=[
-                        (
-                            '${COUNT}',
-                            str(
-                                plus.get_v1_account_misc_read_val(
-                                    'sponsorTickets', 5
-                                )
-                            ),
-                        )
-                    ],
+                label=bui.shared_lstr(
+                    label_resource, (('${COUNT}', str(sponsor_tickets)),)
                 ),
                 tex_name='ticketsMore',
-                enabled=True,
                 tex_opacity=0.6,
                 tex_scale=0.7,
                 text_scale=0.7,
             )
             bui.buttonwidget(edit=cdb, color=(0.65, 0.5, 0.7))
 
-            bui.textwidget(
+            free_txt = bui.textwidget(
                 parent=self._root_widget,
-                text=bui.Lstr(resource=self._r + '.freeText'),
+                text=free_text,
                 position=(
                     h + h_offs + b_size_3[0] * 0.5,
                     v + b_size_3[1] * 0.5 + 25,
@@ -432,23 +320,20 @@ class GetCurrencyWindow(bui.Window):
                 v_align='center',
                 scale=1.0,
             )
-            tc_y_offs = 0
+            if item == 'ad':
+                self._ad_free_text = free_txt
+            v -= 125
 
         h = self._width - (185 + x_inset)
-        v = self._height - 95 + tc_y_offs
+        v = self._height - 95
 
-        txt1 = (
-            bui.Lstr(resource=self._r + '.youHaveText')
-            .evaluate()
-            .partition('${COUNT}')[0]
-            .strip()
-        )
-        txt2 = (
+        txt1, _, txt2 = (
             bui.Lstr(resource=self._r + '.youHaveText')
             .evaluate()
-            .rpartition('${COUNT}')[-1]
-            .strip()
+            .partition('${COUNT}')
         )
+        txt1 = txt1.strip()
+        txt2 = txt2.strip()
 
         bui.textwidget(
             parent=self._root_widget,
@@ -524,10 +409,10 @@ class GetCurrencyWindow(bui.Window):
                 self._ticking_sound = bui.getsound('scoreIncrease')
                 self._ticking_sound.play()
 
-        bui.textwidget(
-            edit=self._ticket_count_text,
-            text=str(int(self._smooth_ticket_count)),
-        )
+        count = int(self._smooth_ticket_count)
+        if count != self._shown_ticket_count:
+            self._shown_ticket_count = count
+            bui.textwidget(edit=self._ticket_count_text, text=str(count))
 
         # If we've reached the target, kill the timer/sound/etc.
         if finished:
@@ -538,8 +423,6 @@ class GetCurrencyWindow(bui.Window):
                 bui.getsound('cashRegister2').play()
 
     def _update(self) -> None:
-        import datetime
-
         plus = bui.app.plus
         assert plus is not None
 
@@ -548,46 +431,58 @@ class GetCurrencyWindow(bui.Window):
             self._back()
             return
 
-        self._ticket_count = plus.get_v1_account_ticket_count()
+        ticket_count = plus.get_v1_account_ticket_count()
+        if (
+            ticket_count != self._ticket_count
+            or self._smooth_ticket_count is None
+        ):
+            self._ticket_count = ticket_count
+            self._on_ticket_count_changed()
 
         # update our incentivized ad button depending on whether ads are
         # available
         if self._ad_button is not None:
-            next_reward_ad_time = plus.get_v1_account_misc_read_val_2(
-                'nextRewardAdTime', None
-            )
-            if next_reward_ad_time is not None:
-                next_reward_ad_time = datetime.datetime.utcfromtimestamp(
-                    next_reward_ad_time
-                )
-            now = datetime.datetime.utcnow()
-            if bui.have_incentivized_ad() and (
-                next_reward_ad_time is None or next_reward_ad_time <= now
-            ):
-                self._ad_button_greyed = False
-                bui.buttonwidget(edit=self._ad_button, color=(0.65, 0.5, 0.7))
-                bui.textwidget(edit=self._ad_label, color=(0.7, 0.9, 0.7, 1.0))
-                bui.textwidget(edit=self._ad_free_text, color=(1, 1, 0, 1))
-                bui.imagewidget(edit=self._ad_image, opacity=0.6)
-                bui.textwidget(edit=self._ad_time_text, text='')
-            else:
-                self._ad_button_greyed = True
+            self._update_ad_button()
+
+    def _update_ad_button(self) -> None:
+        next_reward_ad_time = _get_next_reward_ad_time()
+        now = datetime.datetime.utcnow()
+        greyed = not (
+            bui.have_incentivized_ad()
+            and (next_reward_ad_time is None or next_reward_ad_time <= now)
+        )
+
+        # Only push color changes when our greyed state flips; our
+        # widgets are created in the non-greyed state.
+        if greyed != self._ad_button_greyed:
+            self._ad_button_greyed = greyed
+            if greyed:
                 bui.buttonwidget(edit=self._ad_button, color=(0.5, 0.5, 0.5))
                 bui.textwidget(edit=self._ad_label, color=(0.7, 0.9, 0.7, 0.2))
                 bui.textwidget(edit=self._ad_free_text, color=(1, 1, 0, 0.2))
                 bui.imagewidget(edit=self._ad_image, opacity=0.6 * 0.25)
-                sval: str | bui.Lstr
-                if (
-                    next_reward_ad_time is not None
-                    and next_reward_ad_time > now
-                ):
-                    sval = bui.timestring(
-                        (next_reward_ad_time - now).total_seconds(), centi=False
-                    )
-                else:
-                    sval = ''
-                bui.textwidget(edit=self._ad_time_text, text=sval)
+            else:
+                bui.buttonwidget(edit=self._ad_button, color=(0.65, 0.5, 0.7))
+                bui.textwidget(edit=self._ad_label, color=(0.7, 0.9, 0.7, 1.0))
+                bui.textwidget(edit=self._ad_free_text, color=(1, 1, 0, 1))
+                bui.imagewidget(edit=self._ad_image, opacity=0.6)
 
+        # Likewise only update the countdown when its seconds change.
+        secs: int | None = None
+        if (
+            greyed
+            and next_reward_ad_time is not None
+            and next_reward_ad_time > now
+        ):
+            secs = int((next_reward_ad_time - now).total_seconds())
+        if secs != self._ad_time_secs:
+            self._ad_time_secs = secs
+            bui.textwidget(
+                edit=self._ad_time_text,
+                text='' if secs is None else bui.timestring(secs, centi=False),
+            )
+
+    def _on_ticket_count_changed(self) -> None:
         # if this is our first update, assign immediately; otherwise kick
         # off a smooth transition if the value has changed
         if self._smooth_ticket_count is None:
@@ -599,7 +494,7 @@ class GetCurrencyWindow(bui.Window):
             and self._smooth_update_timer is None
         ):
             self._smooth_update_timer = bui.AppTimer(
-                0.05, bui.WeakCall(self._smooth_update), repeat=True
+                0.05, self._smooth_update_call, repeat=True
             )
             diff = abs(float(self._ticket_count) - self._smooth_ticket_count)
             self._smooth_increase_speed = (
@@ -702,16 +597,8 @@ class GetCurrencyWindow(bui.Window):
         assert plus is not None
 
         if item == 'ad':
-            import datetime
-
             # if ads are disabled until some time, error..
-            next_reward_ad_time = plus.get_v1_account_misc_read_val_2(
-                'nextRewardAdTime', None
-            )
-            if next_reward_ad_time is not None:
-                next_reward_ad_time = datetime.datetime.utcfromtimestamp(
-                    next_reward_ad_time
-                )
+            next_reward_ad_time = _get_next_reward_ad_time()
             now = datetime.datetime.utcnow()
             if (
                 next_reward_ad_time is not None and next_reward_ad_time > now
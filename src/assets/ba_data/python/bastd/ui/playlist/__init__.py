@@ -4,58 +4,92 @@
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import babase
 import bascenev1 as bs
 
 if TYPE_CHECKING:
-    import baclassic
-    import bascenev1 as bs
+    from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class _PlaylistKind:
+    """Fixed values for one playlist type."""
+
+    get_default_list_call: Callable[[], list[dict[str, Any]]]
+    session_type_name: str
+    config_name: str
+    play_mode_resource: str
+    play_mode_fallback_resource: str
+
+
+@functools.cache
+def _playlist_kinds() -> dict[type[bs.Session], _PlaylistKind]:
+    from bascenev1.internal import (
+        get_default_teams_playlist,
+        get_default_free_for_all_playlist,
+    )
+
+    return {
+        bs.DualTeamSession: _PlaylistKind(
+            get_default_list_call=get_default_teams_playlist,
+            session_type_name='ba.DualTeamSession',
+            config_name='Team Tournament',
+            play_mode_resource='playModes.teamsText',
+            play_mode_fallback_resource='teamsText',
+        ),
+        bs.FreeForAllSession: _PlaylistKind(
+            get_default_list_call=get_default_free_for_all_playlist,
+            session_type_name='ba.FreeForAllSession',
+            config_name='Free-for-All',
+            play_mode_resource='playModes.freeForAllText',
+            play_mode_fallback_resource='freeForAllText',
+        ),
+    }
 
 
 # FIXME: Could change this to be a classmethod of session types?
 class PlaylistTypeVars:
     """Defines values for a playlist type (config names to use, etc)."""
 
+    __slots__ = (
+        'sessiontype',
+        'get_default_list_call',
+        'session_type_name',
+        'config_name',
+        'window_title_name',
+        'default_list_name',
+        'default_new_list_name',
+    )
+
     def __init__(self, sessiontype: type[bs.Session]):
-        from bascenev1.internal import (
-            get_default_teams_playlist,
-            get_default_free_for_all_playlist,
-        )
+        kinds = _playlist_kinds()
 
-        self.sessiontype: type[bs.Session]
-
-        if issubclass(sessiontype, bs.DualTeamSession):
-            play_mode_name = babase.Lstr(
-                resource='playModes.teamsText', fallback_resource='teamsText'
-            )
-            self.get_default_list_call = get_default_teams_playlist
-            self.session_type_name = 'ba.DualTeamSession'
-            self.config_name = 'Team Tournament'
-            self.window_title_name = babase.Lstr(
-                resource='playModes.teamsText', fallback_resource='teamsText'
-            )
-            self.sessiontype = bs.DualTeamSession
-
-        elif issubclass(sessiontype, bs.FreeForAllSession):
-            play_mode_name = babase.Lstr(
-                resource='playModes.freeForAllText',
-                fallback_resource='freeForAllText',
-            )
-            self.get_default_list_call = get_default_free_for_all_playlist
-            self.session_type_name = 'ba.FreeForAllSession'
-            self.config_name = 'Free-for-All'
-            self.window_title_name = babase.Lstr(
-                resource='playModes.freeForAllText',
-                fallback_resource='freeForAllText',
-            )
-            self.sessiontype = bs.FreeForAllSession
-
-        else:
-            raise RuntimeError(
-                f'Playlist type vars undefined for sessiontype: {sessiontype}'
-            )
+        # Exact match is the common case; fall back to a subclass scan.
+        kind = kinds.get(sessiontype)
+        if kind is None:
+            for basetype, basekind in kinds.items():
+                if issubclass(sessiontype, basetype):
+                    sessiontype, kind = basetype, basekind
+                    break
+            else:
+                raise RuntimeError(
+                    f'Playlist type vars undefined for sessiontype:'
+                    f' {sessiontype}'
+                )
+
+        self.sessiontype: type[bs.Session] = sessiontype
+        self.get_default_list_call = kind.get_default_list_call
+        self.session_type_name = kind.session_type_name
+        self.config_name = kind.config_name
+        play_mode_name = babase.Lstr(
+            resource=kind.play_mode_resource,
+            fallback_resource=kind.play_mode_fallback_resource,
+        )
+        self.window_title_name = play_mode_name
         self.default_list_name = babase.Lstr(
             resource='defaultGameListNameText',
             subs=[('${PLAYMODE}', play_mode_name)],
@@ -5,14 +5,46 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from threading import Thread
+import importlib
 import logging
+import sys
 
 import bauiv1 as bui
 
 if TYPE_CHECKING:
     pass
 
+# Modules for the windows we can jump to; preloaded once we're up.
+_PRELOAD_MODULES = (
+    'bastd.ui.mainmenu',
+    'bastd.ui.settings.controls',
+    'bastd.ui.settings.graphics',
+    'bastd.ui.settings.audio',
+    'bastd.ui.settings.advanced',
+)
+
+
+# Our category buttons: selection name, title resource, icon texture,
+# icon size, icon offset, and icon color.
+_CATEGORY_BUTTONS: tuple[
+    tuple[
+        str, str, str, float, tuple[float, float], tuple[float, float, float]
+    ],
+    ...,
+] = (
+    (
+        'Controllers',
+        'controllersText',
+        'controllerIcon',
+        130,
+        (0, 35),
+        (1, 1, 1),
+    ),
+    ('Graphics', 'graphicsText', 'graphicsIcon', 110, (0, 42), (1, 1, 1)),
+    ('Audio', 'audioText', 'audioIcon', 120, (5, 35), (1, 1, 0)),
+    ('Advanced', 'advancedText', 'advancedIcon', 120, (5, 35), (0.8, 0.95, 1)),
+)
+
 
 class AllSettingsWindow(bui.Window):
     """Window for selecting a settings category."""
@@ -25,10 +57,6 @@ class AllSettingsWindow(bui.Window):
         # pylint: disable=too-many-statements
         # pylint: disable=too-many-locals
 
-        # Preload some modules we use in a background thread so we won't
-        # have a visual hitch when the user taps them.
-        Thread(target=self._preload_modules).start()
-
         bui.set_analytics_screen('Settings Window')
         scale_origin: tuple[float, float] | None
         if origin_widget is not None:
@@ -39,14 +67,14 @@ class AllSettingsWindow(bui.Window):
             self._transition_out = 'out_right'
             scale_origin = None
         assert bui.app.classic is not None
-        uiscale = bui.app.classic.ui.uiscale
+        ui = bui.app.classic.ui
+        uiscale = ui.uiscale
         width = 900 if uiscale is bui.UIScale.SMALL else 580
         x_inset = 75 if uiscale is bui.UIScale.SMALL else 0
         height = 435
         self._r = 'settingsWindow'
         top_extra = 20 if uiscale is bui.UIScale.SMALL else 0
 
-        uiscale = bui.app.classic.ui.uiscale
         super().__init__(
             root_widget=bui.containerwidget(
                 size=(width, height + top_extra),
@@ -66,7 +94,7 @@ class AllSettingsWindow(bui.Window):
             )
         )
 
-        if bui.app.classic.ui.use_toolbars and uiscale is bui.UIScale.SMALL:
+        if ui.use_toolbars and uiscale is bui.UIScale.SMALL:
             self._back_button = None
             bui.containerwidget(
                 edit=self._root_widget, on_cancel_call=self._do_back
@@ -79,7 +107,7 @@ class AllSettingsWindow(bui.Window):
                 size=(130, 60),
                 scale=0.8,
                 text_scale=1.2,
-                label=bui.Lstr(resource='backText'),
+                label=bui.shared_lstr('backText'),
                 button_type='back',
                 on_activate_call=self._do_back,
             )
@@ -89,8 +117,8 @@ class AllSettingsWindow(bui.Window):
             parent=self._root_widget,
             position=(0, height - 44),
             size=(width, 25),
-            text=bui.Lstr(resource=self._r + '.titleText'),
-            color=bui.app.classic.ui.title_color,
+            text=bui.shared_lstr(self._r + '.titleText'),
+            color=ui.title_color,
             h_align='center',
             v_align='center',
             maxwidth=130,
@@ -109,127 +137,91 @@ class AllSettingsWindow(bui.Window):
 
         basew = 280 if uiscale is bui.UIScale.SMALL else 230
         baseh = 170
-        x_offs = (
-            x_inset + (105 if uiscale is bui.UIScale.SMALL else 72) - basew
-        )  # now unused
-        x_offs2 = x_offs + basew - 7
-        x_offs3 = x_offs + 2 * (basew - 7)
-        x_offs4 = x_offs2
-        x_offs5 = x_offs3
-
-        def _b_title(
-            x: float, y: float, button: bui.Widget, text: str | bui.Lstr
-        ) -> None:
+        x_offs = x_inset + (105 if uiscale is bui.UIScale.SMALL else 72) - 7
+
+        # Lay out our category buttons in a 2x2 grid.
+        handlers = {
+            'Controllers': self._do_controllers,
+            'Graphics': self._do_graphics,
+            'Audio': self._do_audio,
+            'Advanced': self._do_advanced,
+        }
+        buttons: list[bui.Widget] = []
+        for i, (name, rsrc, tex, imgsize, imgoffs, imgcolor) in enumerate(
+            _CATEGORY_BUTTONS
+        ):
+            x = x_offs + (i % 2) * (basew - 7)
+            y = v - (i // 2) * (baseh - 5)
+            btn = bui.buttonwidget(
+                parent=self._root_widget,
+                autoselect=True,
+                position=(x, y),
+                size=(basew, baseh),
+                button_type='square',
+                label='',
+                on_activate_call=handlers[name],
+            )
             bui.textwidget(
                 parent=self._root_widget,
-                text=text,
+                text=bui.shared_lstr(f'{self._r}.{rsrc}'),
                 position=(x + basew * 0.47, y + baseh * 0.22),
                 maxwidth=basew * 0.7,
                 size=(0, 0),
                 h_align='center',
                 v_align='center',
-                draw_controller=button,
+                draw_controller=btn,
                 color=(0.7, 0.9, 0.7, 1.0),
             )
-
-        ctb = self._controllers_button = bui.buttonwidget(
-            parent=self._root_widget,
-            autoselect=True,
-            position=(x_offs2, v),
-            size=(basew, baseh),
-            button_type='square',
-            label='',
-            on_activate_call=self._do_controllers,
-        )
-        if bui.app.classic.ui.use_toolbars and self._back_button is None:
-            bbtn = bui.get_special_widget('back_button')
-            bui.widget(edit=ctb, left_widget=bbtn)
-        _b_title(
-            x_offs2, v, ctb, bui.Lstr(resource=self._r + '.controllersText')
-        )
-        imgw = imgh = 130
-        bui.imagewidget(
-            parent=self._root_widget,
-            position=(x_offs2 + basew * 0.49 - imgw * 0.5, v + 35),
-            size=(imgw, imgh),
-            texture=bui.gettexture('controllerIcon'),
-            draw_controller=ctb,
-        )
-
-        gfxb = self._graphics_button = bui.buttonwidget(
-            parent=self._root_widget,
-            autoselect=True,
-            position=(x_offs3, v),
-            size=(basew, baseh),
-            button_type='square',
-            label='',
-            on_activate_call=self._do_graphics,
-        )
-        if bui.app.classic.ui.use_toolbars:
+            bui.imagewidget(
+                parent=self._root_widget,
+                position=(
+                    x + basew * 0.49 - imgsize * 0.5 + imgoffs[0],
+                    y + imgoffs[1],
+                ),
+                size=(imgsize, imgsize),
+                color=imgcolor,
+                texture=bui.gettexture(tex),
+                draw_controller=btn,
+            )
+            buttons.append(btn)
+        (
+            self._controllers_button,
+            self._graphics_button,
+            self._audio_button,
+            self._advanced_button,
+        ) = buttons
+
+        if ui.use_toolbars:
+            if self._back_button is None:
+                bbtn = bui.get_special_widget('back_button')
+                bui.widget(edit=self._controllers_button, left_widget=bbtn)
             pbtn = bui.get_special_widget('party_button')
-            bui.widget(edit=gfxb, up_widget=pbtn, right_widget=pbtn)
-        _b_title(x_offs3, v, gfxb, bui.Lstr(resource=self._r + '.graphicsText'))
-        imgw = imgh = 110
-        bui.imagewidget(
-            parent=self._root_widget,
-            position=(x_offs3 + basew * 0.49 - imgw * 0.5, v + 42),
-            size=(imgw, imgh),
-            texture=bui.gettexture('graphicsIcon'),
-            draw_controller=gfxb,
-        )
-
-        v -= baseh - 5
+            bui.widget(
+                edit=self._graphics_button, up_widget=pbtn, right_widget=pbtn
+            )
 
-        abtn = self._audio_button = bui.buttonwidget(
-            parent=self._root_widget,
-            autoselect=True,
-            position=(x_offs4, v),
-            size=(basew, baseh),
-            button_type='square',
-            label='',
-            on_activate_call=self._do_audio,
-        )
-        _b_title(x_offs4, v, abtn, bui.Lstr(resource=self._r + '.audioText'))
-        imgw = imgh = 120
-        bui.imagewidget(
-            parent=self._root_widget,
-            position=(x_offs4 + basew * 0.49 - imgw * 0.5 + 5, v + 35),
-            size=(imgw, imgh),
-            color=(1, 1, 0),
-            texture=bui.gettexture('audioIcon'),
-            draw_controller=abtn,
-        )
+        # Names we save/restore our selection under.
+        self._sel_widgets: dict[str, bui.Widget] = dict(zip(handlers, buttons))
+        if self._back_button is not None:
+            self._sel_widgets['Back'] = self._back_button
+        self._sel_names = {w: n for n, w in self._sel_widgets.items()}
 
-        avb = self._advanced_button = bui.buttonwidget(
-            parent=self._root_widget,
-            autoselect=True,
-            position=(x_offs5, v),
-            size=(basew, baseh),
-            button_type='square',
-            label='',
-            on_activate_call=self._do_advanced,
-        )
-        _b_title(x_offs5, v, avb, bui.Lstr(resource=self._r + '.advancedText'))
-        imgw = imgh = 120
-        bui.imagewidget(
-            parent=self._root_widget,
-            position=(x_offs5 + basew * 0.49 - imgw * 0.5 + 5, v + 35),
-            size=(imgw, imgh),
-            color=(0.8, 0.95, 1),
-            texture=bui.gettexture('advancedIcon'),
-            draw_controller=avb,
-        )
         self._restore_state()
 
-    # noinspection PyUnresolvedReferences
+        # Preload some modules we use so we won't have a visual hitch
+        # when the user taps them. We do this on a short timer rather
+        # than in a background thread; importing holds the GIL either
+        # way, and this keeps it from fighting our widget construction.
+        # (Once they're all loaded there's nothing left to do.)
+        if any(m not in sys.modules for m in _PRELOAD_MODULES):
+            bui.apptimer(0.1, self._preload_modules)
+
     @staticmethod
     def _preload_modules() -> None:
-        """Preload modules we use (called in bg thread)."""
-        import bastd.ui.mainmenu as _unused1
-        import bastd.ui.settings.controls as _unused2
-        import bastd.ui.settings.graphics as _unused3
-        import bastd.ui.settings.audio as _unused4
-        import bastd.ui.settings.advanced as _unused5
+        """Preload modules we use (called once the window is built)."""
+        for modulename in _PRELOAD_MODULES:
+            if modulename not in sys.modules:
+                importlib.import_module(modulename)
 
     def _do_back(self) -> None:
         # pylint: disable=cyclic-import
@@ -297,47 +289,27 @@ class AllSettingsWindow(bui.Window):
         )
 
     def _save_state(self) -> None:
-        try:
-            sel = self._root_widget.get_selected_child()
-            if sel == self._controllers_button:
-                sel_name = 'Controllers'
-            elif sel == self._graphics_button:
-                sel_name = 'Graphics'
-            elif sel == self._audio_button:
-                sel_name = 'Audio'
-            elif sel == self._advanced_button:
-                sel_name = 'Advanced'
-            elif sel == self._back_button:
-                sel_name = 'Back'
-            else:
-                raise ValueError(f'unrecognized selection \'{sel}\'')
-            assert bui.app.classic is not None
-            bui.app.classic.ui.window_states[type(self)] = {
-                'sel_name': sel_name
-            }
-        except Exception:
-            logging.exception('Error saving state for %s.', self)
+        sel = self._root_widget.get_selected_child()
+        sel_name = None if sel is None else self._sel_names.get(sel)
+        if sel_name is None:
+            logging.error(
+                'Error saving state for %s: unrecognized selection \'%s\'.',
+                self,
+                sel,
+            )
+            return
+        assert bui.app.classic is not None
+        bui.app.classic.ui.window_states[type(self)] = {'sel_name': sel_name}
 
     def _restore_state(self) -> None:
+        assert bui.app.classic is not None
         try:
-            assert bui.app.classic is not None
-            sel_name = bui.app.classic.ui.window_states.get(type(self), {}).get(
-                'sel_name'
-            )
-            sel: bui.Widget | None
-            if sel_name == 'Controllers':
-                sel = self._controllers_button
-            elif sel_name == 'Graphics':
-                sel = self._graphics_button
-            elif sel_name == 'Audio':
-                sel = self._audio_button
-            elif sel_name == 'Advanced':
-                sel = self._advanced_button
-            elif sel_name == 'Back':
-                sel = self._back_button
-            else:
-                sel = self._controllers_button
-            if sel is not None:
-                bui.containerwidget(edit=self._root_widget, selected_child=sel)
-        except Exception:
-            logging.exception('Error restoring state for %s.', self)
+            sel_name = bui.app.classic.ui.window_states[type(self)]['sel_name']
+        except KeyError:
+            sel_name = None
+        # A saved 'Back' with no back button leaves selection alone;
+        # anything else we don't know falls back to Controllers.
+        if sel_name == 'Back' and self._back_button is None:
+            return
+        sel = self._sel_widgets.get(sel_name, self._controllers_button)
+        bui.containerwidget(edit=self._root_widget, selected_child=sel)
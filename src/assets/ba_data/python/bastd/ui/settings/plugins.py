@@ -12,6 +12,11 @@ if TYPE_CHECKING:
     pass
 
 
+# Height of each plugin row, and how many rows we build per pass.
+_PLUG_LINE_HEIGHT = 50
+_ROW_BATCH_SIZE = 8
+
+
 class PluginWindow(bui.Window):
     """Window for configuring plugins."""
 
@@ -34,8 +39,9 @@ class PluginWindow(bui.Window):
             self._transition_out = 'out_right'
             scale_origin = None
 
-        assert bui.app.classic is not None
-        uiscale = bui.app.classic.ui.uiscale
+        assert app.classic is not None
+        ui = app.classic.ui
+        uiscale = ui.uiscale
         self._width = 870.0 if uiscale is bui.UIScale.SMALL else 670.0
         x_inset = 100 if uiscale is bui.UIScale.SMALL else 0
         self._height = (
@@ -70,8 +76,7 @@ class PluginWindow(bui.Window):
         self._sub_width = self._scroll_width * 0.95
         self._sub_height = 724.0
 
-        assert app.classic is not None
-        if app.classic.ui.use_toolbars and uiscale is bui.UIScale.SMALL:
+        if ui.use_toolbars and uiscale is bui.UIScale.SMALL:
             bui.containerwidget(
                 edit=self._root_widget, on_cancel_call=self._do_back
             )
@@ -83,7 +88,7 @@ class PluginWindow(bui.Window):
                 size=(140, 60),
                 scale=0.8,
                 autoselect=True,
-                label=bui.Lstr(resource='backText'),
+                label=bui.shared_lstr('backText'),
                 button_type='back',
                 on_activate_call=self._do_back,
             )
@@ -95,8 +100,8 @@ class PluginWindow(bui.Window):
             parent=self._root_widget,
             position=(0, self._height - 52),
             size=(self._width, 25),
-            text=bui.Lstr(resource='pluginsText'),
-            color=app.classic.ui.title_color,
+            text=bui.shared_lstr('pluginsText'),
+            color=ui.title_color,
             h_align='center',
             v_align='top',
         )
@@ -141,41 +146,67 @@ class PluginWindow(bui.Window):
         )
         bui.widget(edit=self._scrollwidget, right_widget=self._scrollwidget)
 
-        if bui.app.meta.scanresults is None:
+        if app.meta.scanresults is None:
             bui.screenmessage(
                 'Still scanning plugins; please try again.', color=(1, 0, 0)
             )
             bui.getsound('error').play()
-        pluglist = bui.app.plugins.potential_plugins
-        plugstates: dict[str, dict] = bui.app.config.setdefault('Plugins', {})
+        pluglist = app.plugins.potential_plugins
+        plugstates: dict[str, dict] = app.config.setdefault('Plugins', {})
         assert isinstance(plugstates, dict)
+        for availplug in pluglist:
+            plugstates.setdefault(availplug.class_path, {})
 
-        plug_line_height = 50
-        sub_width = self._scroll_width
-        sub_height = len(pluglist) * plug_line_height
         self._subcontainer = bui.containerwidget(
             parent=self._scrollwidget,
-            size=(sub_width, sub_height),
+            size=(self._scroll_width, len(pluglist) * _PLUG_LINE_HEIGHT),
             background=False,
         )
 
-        for i, availplug in enumerate(pluglist):
-            plugin = bui.app.plugins.active_plugins.get(availplug.class_path)
+        # Build our rows a batch at a time so the window can show up
+        # without waiting on a long plugin list.
+        self._pluglist = pluglist
+        self._build_rows(0)
+
+        bui.containerwidget(
+            edit=self._root_widget, selected_child=self._scrollwidget
+        )
+
+        self._restore_state()
+
+    def _build_rows(self, start: int) -> None:
+        if not self._subcontainer:
+            return
+        pluglist = self._pluglist
+        end = min(start + _ROW_BATCH_SIZE, len(pluglist))
+        active_plugins = bui.app.plugins.active_plugins
+        plugstates: dict[str, dict] = bui.app.config.setdefault('Plugins', {})
+        assert isinstance(plugstates, dict)
+
+        # Values shared by every plugin row.
+        sub_width = self._scroll_width
+        sub_height = len(pluglist) * _PLUG_LINE_HEIGHT
+        check_maxwidth = self._scroll_width - 200
+        check_size = (self._scroll_width - 40, 50)
+        settings_label = bui.shared_lstr('mainMenu.settingsText')
+
+        for i in range(start, end):
+            availplug = pluglist[i]
+            plugin = active_plugins.get(availplug.class_path)
             active = plugin is not None
 
-            plugstate = plugstates.setdefault(availplug.class_path, {})
-            checked = plugstate.get('enabled', False)
+            checked = plugstates[availplug.class_path].get('enabled', False)
             assert isinstance(checked, bool)
 
-            item_y = sub_height - (i + 1) * plug_line_height
+            item_y = sub_height - (i + 1) * _PLUG_LINE_HEIGHT
             check = bui.checkboxwidget(
                 parent=self._subcontainer,
                 text=availplug.display_name,
                 autoselect=True,
                 value=checked,
-                maxwidth=self._scroll_width - 200,
+                maxwidth=check_maxwidth,
                 position=(10, item_y),
-                size=(self._scroll_width - 40, 50),
+                size=check_size,
                 on_value_change_call=bui.Call(
                     self._check_value_changed, availplug
                 ),
@@ -190,7 +221,7 @@ class PluginWindow(bui.Window):
             if plugin is not None and plugin.has_settings_ui():
                 button = bui.buttonwidget(
                     parent=self._subcontainer,
-                    label=bui.Lstr(resource='mainMenu.settingsText'),
+                    label=settings_label,
                     autoselect=True,
                     size=(100, 40),
                     position=(sub_width - 130, item_y + 6),
@@ -217,17 +248,14 @@ class PluginWindow(bui.Window):
             # keyboard/button nav.
             bui.widget(edit=check, show_buffer_top=40, show_buffer_bottom=40)
 
-        bui.containerwidget(
-            edit=self._root_widget, selected_child=self._scrollwidget
-        )
-
-        self._restore_state()
+        if end < len(pluglist):
+            bui.apptimer(0.0, bui.WeakCall(self._build_rows, end))
 
     def _check_value_changed(
         self, plug: bui.PotentialPlugin, value: bool
     ) -> None:
         bui.screenmessage(
-            bui.Lstr(resource='settingsWindowAdvanced.mustRestartText'),
+            bui.shared_lstr('settingsWindowAdvanced.mustRestartText'),
             color=(1.0, 0.5, 0.0),
         )
         plugstates: dict[str, dict] = bui.app.config.setdefault('Plugins', {})
@@ -12,6 +12,28 @@ if TYPE_CHECKING:
     from typing import Any, Callable
 
 
+_SCALES: dict[bui.UIScale, float] = {
+    bui.UIScale.SMALL: 1.7,
+    bui.UIScale.MEDIUM: 1.4,
+    bui.UIScale.LARGE: 1.0,
+}
+
+
+def _clone_entry(entry: Any) -> Any:
+    """Copy a soundtrack entry.
+
+    Entries are normally None, a str, or a flat dict of strs, none of
+    which need a deepcopy; anything else still gets one.
+    """
+    if entry is None or isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict) and all(
+        isinstance(val, (str, int, float, bool)) for val in entry.values()
+    ):
+        return dict(entry)
+    return copy.deepcopy(entry)
+
+
 class SoundtrackEntryTypeSelectWindow(bui.Window):
     """Window for selecting a soundtrack entry type."""
 
@@ -27,7 +49,7 @@ class SoundtrackEntryTypeSelectWindow(bui.Window):
         self._r = 'editSoundtrackWindow'
 
         self._callback = callback
-        self._current_entry = copy.deepcopy(current_entry)
+        self._current_entry = _clone_entry(current_entry)
 
         self._width = 580
         self._height = 220
@@ -49,8 +71,6 @@ class SoundtrackEntryTypeSelectWindow(bui.Window):
         if do_music_folder:
             self._height += spacing
 
-        uiscale = bui.app.classic.ui.uiscale
-
         # NOTE: When something is selected, we close our UI and kick off
         # another window which then calls us back when its done, so the
         # standard UI-cleanup-check complains that something is holding on
@@ -60,13 +80,7 @@ class SoundtrackEntryTypeSelectWindow(bui.Window):
             root_widget=bui.containerwidget(
                 size=(self._width, self._height),
                 transition=transition,
-                scale=(
-                    1.7
-                    if uiscale is bui.UIScale.SMALL
-                    else 1.4
-                    if uiscale is bui.UIScale.MEDIUM
-                    else 1.0
-                ),
+                scale=_SCALES[bui.app.classic.ui.uiscale],
             ),
             cleanupcheck=False,
         )
@@ -110,7 +110,7 @@ from _bauiv1 import (
     Widget,
     widget,
 )
-from bauiv1.ui import Window, uicleanupcheck
+from bauiv1.ui import Window, uicleanupcheck, shared_lstr
 
 
 __all__ = [
@@ -156,6 +156,7 @@ __all__ = [
     'charstr',
     'UIScale',
     'uicleanupcheck',
+    'shared_lstr',
     'Lstr',
     'app',
     'Call',
@@ -5,10 +5,41 @@
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from typing import cast
 
 import bauiv1 as bui
 
+# Window scale and extra top height for each ui scale.
+_SCALE_PARAMS: dict[bui.UIScale, tuple[float, float]] = {
+    bui.UIScale.SMALL: (2.0, 20),
+    bui.UIScale.MEDIUM: (1.5, 0),
+    bui.UIScale.LARGE: (1.0, 0),
+}
+
+# Key colors shared by all keyboard instances.
+_KEY_COLOR_LIT = (1.4, 1.2, 1.4)
+_KEY_COLOR = (0.69, 0.6, 0.74)
+_KEY_COLOR_DARK = (0.55, 0.55, 0.71)
+
+_g_overlay_stack: bui.Widget | None = None
+
+
+def _get_overlay_stack() -> bui.Widget:
+    """Return the overlay-stack special widget (cached while alive)."""
+    global _g_overlay_stack  # pylint: disable=global-statement
+    if not _g_overlay_stack:
+        _g_overlay_stack = bui.get_special_widget('overlay_stack')
+    return _g_overlay_stack
+
+
+def _keyboard_exports() -> list[str]:
+    """Return class names of all available keyboards."""
+    scanresults = bui.app.meta.scanresults
+    if scanresults is None:
+        return []
+    return scanresults.exports_of_class(bui.Keyboard)
+
 
 class OnScreenKeyboardWindow(bui.Window):
     """Simple built-in on-screen keyboard."""
@@ -18,28 +49,17 @@ class OnScreenKeyboardWindow(bui.Window):
         self._width = 700
         self._height = 400
         assert bui.app.classic is not None
-        uiscale = bui.app.classic.ui.uiscale
-        top_extra = 20 if uiscale is bui.UIScale.SMALL else 0
+        scale, top_extra = _SCALE_PARAMS[bui.app.classic.ui.uiscale]
         super().__init__(
             root_widget=bui.containerwidget(
-                parent=bui.get_special_widget('overlay_stack'),
+                parent=_get_overlay_stack(),
                 size=(self._width, self._height + top_extra),
                 transition='in_scale',
                 scale_origin_stack_offset=(
                     self._target_text.get_screen_space_center()
                 ),
-                scale=(
-                    2.0
-                    if uiscale is bui.UIScale.SMALL
-                    else 1.5
-                    if uiscale is bui.UIScale.MEDIUM
-                    else 1.0
-                ),
-                stack_offset=(0, 0)
-                if uiscale is bui.UIScale.SMALL
-                else (0, 0)
-                if uiscale is bui.UIScale.MEDIUM
-                else (0, 0),
+                scale=scale,
+                stack_offset=(0, 0),
             )
         )
         self._done_button = bui.buttonwidget(
@@ -83,9 +103,8 @@ class OnScreenKeyboardWindow(bui.Window):
             always_show_carat=True,
         )
 
-        self._key_color_lit = (1.4, 1.2, 1.4)
-        self._key_color = (0.69, 0.6, 0.74)
-        self._key_color_dark = (0.55, 0.55, 0.71)
+        self._shift_label = bui.charstr(bui.SpecialChar.SHIFT)
+        self._emoji_label = bui.charstr(bui.SpecialChar.LOGO_FLAT)
 
         self._shift_button: bui.Widget | None = None
         self._backspace_button: bui.Widget | None = None
@@ -94,35 +113,75 @@ class OnScreenKeyboardWindow(bui.Window):
         self._num_mode_button: bui.Widget | None = None
         self._emoji_button: bui.Widget | None = None
         self._char_keys: list[bui.Widget] = []
+        self._char_key_rows: tuple[int, ...] = ()
         self._keyboard_index = 0
         self._last_space_press = 0.0
         self._double_space_interval = 0.3
+        self._click_sound = bui.getsound('click01')
 
         self._keyboard: bui.Keyboard
         self._chars: list[str]
+        self._mode_chars: dict[str, list[str]]
+        self._shown_mode: str | None = None
         self._modes: list[str]
         self._mode: str
         self._mode_index: int
         self._load_keyboard()
 
     def _load_keyboard(self) -> None:
-        # pylint: disable=too-many-locals
         self._keyboard = self._get_keyboard()
         # We want to get just chars without column data, etc.
-        self._chars = [j for i in self._keyboard.chars for j in i]
+        self._chars = list(chain.from_iterable(self._keyboard.chars))
         self._modes = ['normal'] + list(self._keyboard.pages)
         self._mode_index = 0
         self._mode = self._modes[self._mode_index]
 
+        # Chars for each mode; these are fixed for a given keyboard.
+        self._mode_chars = {
+            'normal': self._chars,
+            'caps': [c.upper() for c in self._chars],
+            'num': list(self._keyboard.nums),
+        }
+        for pagename, page in self._keyboard.pages.items():
+            self._mode_chars[pagename] = list(page)
+
+        # Pad out any short pages so every key always has a char.
+        numchars = len(self._chars)
+        for pagename, chars in self._mode_chars.items():
+            if len(chars) < numchars:
+                if bui.do_once():
+                    errstr = (
+                        f'Size of page "{pagename}" of keyboard'
+                        f' "{self._keyboard.name}" is incorrect:'
+                        f' {len(chars)} != {numchars}'
+                        f' (size of default "normal" page)'
+                    )
+                    logging.error(errstr)
+                chars.extend(' ' * (numchars - len(chars)))
+        self._shown_mode = None
+
+        # Our key layout depends only on row lengths; if the new
+        # keyboard matches what we've got, just relabel the keys.
+        char_key_rows = tuple(len(row) for row in self._keyboard.chars)
+        if char_key_rows != self._char_key_rows:
+            self._char_key_rows = char_key_rows
+            self._create_keys()
+
+        bui.containerwidget(
+            edit=self._root_widget, selected_child=self._char_keys[14]
+        )
+
+        self._refresh()
+
+    def _create_keys(self) -> None:
+        # pylint: disable=too-many-locals
         v = self._height - 180.0
         key_width = 46 * 10 / len(self._keyboard.chars[0])
         key_height = 46 * 3 / len(self._keyboard.chars)
         key_textcolor = (1, 1, 1)
         row_starts = (69.0, 95.0, 151.0)
-        key_color = self._key_color
-        key_color_dark = self._key_color_dark
-
-        self._click_sound = bui.getsound('click01')
+        key_color = _KEY_COLOR
+        key_color_dark = _KEY_COLOR_DARK
 
         # kill prev char keys
         for key in self._char_keys:
@@ -144,7 +203,7 @@ class OnScreenKeyboardWindow(bui.Window):
                     autoselect=True,
                     textcolor=key_textcolor,
                     color=key_color_dark,
-                    label=bui.charstr(bui.SpecialChar.SHIFT),
+                    label=self._shift_label,
                     enable_sound=False,
                     extra_touch_border_scale=0.3,
                     button_type='square',
@@ -209,7 +268,7 @@ class OnScreenKeyboardWindow(bui.Window):
                         enable_sound=False,
                         textcolor=key_textcolor,
                         color=key_color_dark,
-                        label=bui.charstr(bui.SpecialChar.LOGO_FLAT),
+                        label=self._emoji_label,
                         extra_touch_border_scale=0.3,
                         button_type='square',
                     )
@@ -225,17 +284,12 @@ class OnScreenKeyboardWindow(bui.Window):
                         textcolor=key_textcolor,
                         color=key_color_dark,
                         label=bui.Lstr(resource='spaceKeyText'),
-                        on_activate_call=bui.Call(self._type_char, ' '),
+                        on_activate_call=self._type_space,
                     )
 
                     # Show change instructions only if we have more than one
                     # keyboard option.
-                    keyboards = (
-                        bui.app.meta.scanresults.exports_of_class(bui.Keyboard)
-                        if bui.app.meta.scanresults is not None
-                        else []
-                    )
-                    if len(keyboards) > 1:
+                    if len(_keyboard_exports()) > 1:
                         bui.textwidget(
                             parent=self._root_widget,
                             h_align='center',
@@ -255,32 +309,27 @@ class OnScreenKeyboardWindow(bui.Window):
                 bui.widget(edit=btn3, left_widget=btn1)
                 bui.widget(edit=self._done_button, left_widget=btn2)
 
-        bui.containerwidget(
-            edit=self._root_widget, selected_child=self._char_keys[14]
-        )
-
-        self._refresh()
-
     def _get_keyboard(self) -> bui.Keyboard:
         assert bui.app.meta.scanresults is not None
-        classname = bui.app.meta.scanresults.exports_of_class(bui.Keyboard)[
-            self._keyboard_index
-        ]
+        classname = _keyboard_exports()[self._keyboard_index]
         kbclass = bui.getclass(classname, bui.Keyboard)
         return kbclass()
 
     def _refresh(self) -> None:
-        chars: list[str] | None = None
+        # Our keys depend only on keyboard and mode, so most keystrokes
+        # have nothing to update.
+        if self._mode == self._shown_mode:
+            return
+        self._shown_mode = self._mode
+
+        chars = self._mode_chars[self._mode]
         if self._mode in ['normal', 'caps']:
-            chars = list(self._chars)
-            if self._mode == 'caps':
-                chars = [c.upper() for c in chars]
             bui.buttonwidget(
                 edit=self._shift_button,
-                color=self._key_color_lit
+                color=_KEY_COLOR_LIT
                 if self._mode == 'caps'
-                else self._key_color_dark,
-                label=bui.charstr(bui.SpecialChar.SHIFT),
+                else _KEY_COLOR_DARK,
+                label=self._shift_label,
                 on_activate_call=self._shift,
             )
             bui.buttonwidget(
@@ -290,18 +339,14 @@ class OnScreenKeyboardWindow(bui.Window):
             )
             bui.buttonwidget(
                 edit=self._emoji_button,
-                color=self._key_color_dark,
-                label=bui.charstr(bui.SpecialChar.LOGO_FLAT),
+                color=_KEY_COLOR_DARK,
+                label=self._emoji_label,
                 on_activate_call=self._next_mode,
             )
         else:
-            if self._mode == 'num':
-                chars = list(self._keyboard.nums)
-            else:
-                chars = list(self._keyboard.pages[self._mode])
             bui.buttonwidget(
                 edit=self._shift_button,
-                color=self._key_color_dark,
+                color=_KEY_COLOR_DARK,
                 label='',
                 on_activate_call=self._null_press,
             )
@@ -312,32 +357,16 @@ class OnScreenKeyboardWindow(bui.Window):
             )
             bui.buttonwidget(
                 edit=self._emoji_button,
-                color=self._key_color_dark,
-                label=bui.charstr(bui.SpecialChar.LOGO_FLAT),
+                color=_KEY_COLOR_DARK,
+                label=self._emoji_label,
                 on_activate_call=self._next_mode,
             )
 
-        for i, btn in enumerate(self._char_keys):
-            assert chars is not None
-            have_char = True
-            if i >= len(chars):
-                # No such char.
-                have_char = False
-                pagename = self._mode
-                if bui.do_once():
-                    errstr = (
-                        f'Size of page "{pagename}" of keyboard'
-                        f' "{self._keyboard.name}" is incorrect:'
-                        f' {len(chars)} != {len(self._chars)}'
-                        f' (size of default "normal" page)'
-                    )
-                    logging.error(errstr)
+        for btn, char in zip(self._char_keys, chars):
             bui.buttonwidget(
                 edit=btn,
-                label=chars[i] if have_char else ' ',
-                on_activate_call=bui.Call(
-                    self._type_char, chars[i] if have_char else ' '
-                ),
+                label=char,
+                on_activate_call=bui.Call(self._type_char, char),
             )
 
     def _null_press(self) -> None:
@@ -361,7 +390,7 @@ class OnScreenKeyboardWindow(bui.Window):
 
     def _next_keyboard(self) -> None:
         assert bui.app.meta.scanresults is not None
-        kbexports = bui.app.meta.scanresults.exports_of_class(bui.Keyboard)
+        kbexports = _keyboard_exports()
         self._keyboard_index = (self._keyboard_index + 1) % len(kbexports)
 
         self._load_keyboard()
@@ -399,6 +428,9 @@ class OnScreenKeyboardWindow(bui.Window):
         txt = txt[:-1]
         bui.textwidget(edit=self._text_field, text=txt)
 
+    def _type_space(self) -> None:
+        self._type_char(' ')
+
     def _type_char(self, char: str) -> None:
         self._click_sound.play()
         if char.isspace():
@@ -421,7 +453,7 @@ class OnScreenKeyboardWindow(bui.Window):
         # If we were caps, go back only if not Shift is pressed twice.
         if self._mode == 'caps' and not self._double_press_shift:
             self._mode = 'normal'
-        self._refresh()
+            self._refresh()
 
     def _cancel(self) -> None:
         bui.getsound('swish').play()
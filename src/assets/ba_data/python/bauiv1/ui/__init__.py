@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import os
 import weakref
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast, Type
 
 import _babase
 import _bauiv1
+from babase._language import Lstr
 
 if TYPE_CHECKING:
     from typing import Any
@@ -204,6 +206,24 @@ def uicleanupcheck(obj: Any, widget: bauiv1.Widget) -> None:
     )
 
 
+@lru_cache(maxsize=256)
+def shared_lstr(
+    resource: str, subs: tuple[tuple[str, str | Lstr], ...] = ()
+) -> Lstr:
+    """Return a shared bauiv1.Lstr for a resource (and optional subs).
+
+    Category: User Interface Functions
+
+    Lstrs are not modified once handed to widgets, so UI code that
+    rebuilds the same widgets repeatedly can use this to avoid
+    allocating fresh instances each time. Subs must be passed as a
+    tuple of tuples so they can be hashed.
+    """
+    if subs:
+        return Lstr(resource=resource, subs=list(subs))
+    return Lstr(resource=resource)
+
+
 def ui_upkeep() -> None:
     """Run UI cleanup checks, etc. should be called periodically."""
     assert _babase.app.classic is not None
@@ -308,6 +308,14 @@ void Logic::StepDisplayTime() {
   display_timers_->Run(g_core->GetAppTimeMillisecs());
 }
 
+auto Logic::GetCachedAppTimeSeconds() -> double {
+  // Before our first step we've got nothing cached; just go direct.
+  if (last_display_time_update_app_time_ < 0.0) {
+    return g_core->GetAppTimeSeconds();
+  }
+  return last_display_time_update_app_time_;
+}
+
 void Logic::UpdateDisplayTime() {
   // Here we update our smoothed display-time-increment based on how fast
   // we are currently rendering frames. We want display-time to basically
@@ -72,6 +72,14 @@ class Logic {
   /// framerate changes but should remain mostly constant.
   auto display_time_increment() -> double { return display_time_increment_; }
 
+  /// Return the app-time (in seconds) as sampled at the start of the most
+  /// recent display-time step. This only changes once per step so it is
+  /// cheaper than querying app-time directly and is consistent for all
+  /// code running between steps. Note that steps happen per frame in gui
+  /// builds but only at 10hz in headless builds, so this can lag actual
+  /// app-time by up to 100ms there.
+  auto GetCachedAppTimeSeconds() -> double;
+
   auto applied_app_config() const { return applied_app_config_; }
 
  private:
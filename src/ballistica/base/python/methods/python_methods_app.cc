@@ -316,6 +316,41 @@ static PyMethodDef PyAppTimeDef = {
     "accidentally used with time functionality expecting other time types.",
 };
 
+// --------------------------- apptime_cached ----------------------------------
+
+static auto PyAppTimeCached(PyObject* self, PyObject* args, PyObject* keywds)
+    -> PyObject* {
+  BA_PYTHON_TRY;
+  static const char* kwlist[] = {nullptr};
+  if (!PyArg_ParseTupleAndKeywords(args, keywds, "",
+                                   const_cast<char**>(kwlist))) {
+    return nullptr;
+  }
+  BA_PRECONDITION(g_base->InLogicThread());
+  return PyFloat_FromDouble(g_base->logic->GetCachedAppTimeSeconds());
+  BA_PYTHON_CATCH;
+}
+
+static PyMethodDef PyAppTimeCachedDef = {
+    "apptime_cached",               // name
+    (PyCFunction)PyAppTimeCached,   // method
+    METH_VARARGS | METH_KEYWORDS,   // flags
+
+    "apptime_cached() -> babase.AppTime\n"
+    "\n"
+    "Return app-time in seconds as of the most recent display-time step.\n"
+    "\n"
+    "Category: **General Utility Functions**\n"
+    "\n"
+    "This is the same clock as babase.apptime() but only sampled once\n"
+    "per display-time step, so it is cheaper to query and returns\n"
+    "identical values for all code running between steps. Display-time\n"
+    "steps happen once per frame in gui builds but only 10 times per\n"
+    "second in headless builds, so the value may lag actual app-time by\n"
+    "up to a frame or up to 100ms respectively. Use babase.apptime()\n"
+    "when precise timing is needed.",
+};
+
 // ------------------------------ apptimer -------------------------------------
 
 static auto PyAppTimer(PyObject* self, PyObject* args, PyObject* keywds)
@@ -1284,6 +1319,7 @@ auto PythonMethodsApp::GetMethods() -> std::vector<PyMethodDef> {
       PyQuitDef,
       PyAppTimerDef,
       PyAppTimeDef,
+      PyAppTimeCachedDef,
       PyDisplayTimeDef,
       PyDisplayTimerDef,
       PyPushCallDef,
@@ -0,0 +1,189 @@
+# Released under the MIT License. See LICENSE for details.
+#
+"""Testing featureset functionality."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from efro.error import CleanError
+from batools.featureset import FeatureSet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_config(path: str, requirements: set[str]) -> None:
+    with open(path, 'w', encoding='utf-8') as outfile:
+        outfile.write(
+            'from batools.featureset import FeatureSet\n'
+            'fset = FeatureSet.get_active()\n'
+            f'fset.requirements = set({sorted(requirements)!r})\n'
+        )
+
+
+def _make_project(root: Path, featuresets: dict[str, set[str]]) -> str:
+    fsdir = os.path.join(root, 'config', 'featuresets')
+    os.makedirs(fsdir)
+    for name, requirements in featuresets.items():
+        _write_config(
+            os.path.join(fsdir, f'featureset_{name}.py'), requirements
+        )
+    return str(root)
+
+
+def _make_featureset(name: str, requirements: set[str]) -> FeatureSet:
+    featureset = FeatureSet(name)
+    featureset.requirements = requirements
+    return featureset
+
+
+def test_resolve_requirements() -> None:
+    """Test requirement resolution with list and dict inputs."""
+    fslist = [
+        _make_featureset('core', set()),
+        _make_featureset('base', {'core'}),
+        _make_featureset('scene_v1', {'base'}),
+        _make_featureset('ui_v1', {'base'}),
+        _make_featureset('classic', {'scene_v1', 'ui_v1'}),
+    ]
+    fsdict = {f.name: f for f in fslist}
+
+    for fsets in (fslist, fsdict):
+        assert FeatureSet.resolve_requirements(fsets, set()) == set()
+        assert FeatureSet.resolve_requirements(fsets, {'core'}) == {'core'}
+        assert FeatureSet.resolve_requirements(fsets, {'scene_v1'}) == {
+            'core',
+            'base',
+            'scene_v1',
+        }
+        assert FeatureSet.resolve_requirements(fsets, {'classic', 'core'}) == {
+            'core',
+            'base',
+            'scene_v1',
+            'ui_v1',
+            'classic',
+        }
+
+        with pytest.raises(CleanError):
+            FeatureSet.resolve_requirements(fsets, {'nonexistent'})
+
+    # Requirements pointing at missing feature-sets should be caught
+    # while walking too.
+    fslist.append(_make_featureset('broken', {'nonexistent'}))
+    with pytest.raises(CleanError):
+        FeatureSet.resolve_requirements(fslist, {'broken'})
+
+
+def test_resolve_requirements_cycles() -> None:
+    """Test that cyclic requirements resolve without looping forever."""
+    fslist = [
+        _make_featureset('foo', {'bar'}),
+        _make_featureset('bar', {'baz'}),
+        _make_featureset('baz', {'foo'}),
+        _make_featureset('other', {'foo'}),
+    ]
+    assert FeatureSet.resolve_requirements(fslist, {'bar'}) == {
+        'foo',
+        'bar',
+        'baz',
+    }
+    assert FeatureSet.resolve_requirements(fslist, {'other'}) == {
+        'foo',
+        'bar',
+        'baz',
+        'other',
+    }
+
+
+def test_project_requirement_closures(tmp_path: Path) -> None:
+    """Test closures precalced when loading a project's feature-sets."""
+    project_root = _make_project(
+        tmp_path,
+        {
+            'core': set(),
+            'base': {'core'},
+            'ping': {'pong', 'base'},
+            'pong': {'ping'},
+        },
+    )
+    featuresets = FeatureSet.get_all_for_project(project_root)
+    assert [f.name for f in featuresets] == ['base', 'core', 'ping', 'pong']
+
+    # Subsequent calls should give us the same cached results.
+    assert FeatureSet.get_all_for_project(project_root) is featuresets
+
+    # pylint: disable=protected-access
+    closures = {f.name: f._requirements_closure for f in featuresets}
+    assert closures == {
+        'core': {'core'},
+        'base': {'core', 'base'},
+        'ping': {'core', 'base', 'ping', 'pong'},
+        'pong': {'core', 'base', 'ping', 'pong'},
+    }
+    assert FeatureSet.resolve_requirements(featuresets, {'pong'}) == {
+        'core',
+        'base',
+        'ping',
+        'pong',
+    }
+
+
+def test_project_name_clash(tmp_path: Path) -> None:
+    """Test that names resolving to the same compact name are caught."""
+    project_root = _make_project(
+        tmp_path, {'core': set(), 'foo_v1': set(), 'foov_1': set()}
+    )
+    with pytest.raises(CleanError, match='compact name'):
+        FeatureSet.get_all_for_project(project_root)
+
+
+def test_project_bad_requirements(tmp_path: Path) -> None:
+    """Test that self and undefined requirements are caught."""
+    project_root = _make_project(tmp_path / 'a', {'foo': {'foo'}})
+    with pytest.raises(CleanError, match='itself'):
+        FeatureSet.get_all_for_project(project_root)
+
+    project_root = _make_project(tmp_path / 'b', {'foo': {'bar'}})
+    with pytest.raises(CleanError, match='Undefined'):
+        FeatureSet.get_all_for_project(project_root)
+
+
+def test_validate_name() -> None:
+    """Test feature-set name validation."""
+    for name in ('core', 'scene_v1', 'foo2_bar3', 'a'):
+        FeatureSet.validate_name(name)
+    for name in (
+        '',
+        '1foo',
+        '_foo',
+        'foo_',
+        'foo__bar',
+        'Foo',
+        'foo-bar',
+        'foo bar',
+    ):
+        with pytest.raises(CleanError):
+            FeatureSet.validate_name(name)
+
+
+def test_config_cache_invalidation(tmp_path: Path) -> None:
+    """Test that compiled configs are recompiled when modified."""
+    config_path = os.path.join(tmp_path, 'featureset_foo.py')
+    _write_config(config_path, {'bar'})
+    featureset = FeatureSet('foo')
+    featureset.apply_config(config_path)
+    assert featureset.requirements == {'bar'}
+
+    # Rewrite the config and make sure its mtime differs even on
+    # filesystems with coarse timestamps.
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    _write_config(config_path, {'baz'})
+    os.utime(config_path, ns=(mtime_ns + 1_000_000_000,) * 2)
+
+    featureset = FeatureSet('foo')
+    featureset.apply_config(config_path)
+    assert featureset.requirements == {'baz'}
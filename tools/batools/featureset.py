@@ -11,61 +11,124 @@ filtering alone.
 from __future__ import annotations
 
 import os
+import re
+import threading
 from typing import TYPE_CHECKING
 
-from efro.util import snake_case_to_title
 from efro.error import CleanError
 
 if TYPE_CHECKING:
-    pass
+    from types import CodeType
 
-# Cached feature-sets indexed by project root.
+# Cached feature-sets indexed by (real) project root.
 _g_feature_sets: dict[str, list[FeatureSet]] = {}
 
+# Matches all typical valid feature-set names (lowercase ascii words
+# separated by single underscores).
+_VALID_NAME_RE = re.compile(r'[a-z][a-z0-9]*(?:_[a-z0-9]+)*')
+
+# The FeatureSet whose config is being applied in the current thread.
+_g_active = threading.local()
+
+# Compiled feature-set configs indexed by path and modtime.
+_g_compiled_configs: dict[tuple[str, int], CodeType] = {}
+
 
 class FeatureSet:
     """Defines a feature-set."""
 
-    _active_feature_set: FeatureSet | None = None
-
     @classmethod
     def get_all_for_project(cls, project_root: str) -> list[FeatureSet]:
         """Return all feature-sets for the current project."""
-        project_root_abs = os.path.abspath(project_root)
+        # Key on real path so symlinked paths to the same project share
+        # a single scan.
+        project_root_real = os.path.realpath(project_root)
 
         # Only do this once per project.
-        if project_root_abs not in _g_feature_sets:
-            _g_feature_sets[project_root_abs] = _build_feature_set_list(
-                project_root_abs
+        featuresets = _g_feature_sets.get(project_root_real)
+        if featuresets is None:
+            fsmap = _build_feature_set_map(project_root_real)
+            cls._calc_requirement_closures(fsmap)
+            featuresets = list(fsmap.values())
+            _g_feature_sets[project_root_real] = featuresets
+        return featuresets
+
+    @classmethod
+    def get_all_names_for_project(cls, project_root: str) -> list[str]:
+        """Return names of all feature-sets for the current project.
+
+        This only looks at config filenames and does not run any configs,
+        so it is cheaper than get_all_for_project() when only names are
+        needed.
+        """
+        names = [
+            name
+            for name, _path in _scan_feature_set_configs(
+                os.path.realpath(project_root)
             )
-        return _g_feature_sets[project_root_abs]
+        ]
+        for name in names:
+            cls.validate_name(name)
+        return names
 
     @classmethod
     def resolve_requirements(
-        cls, featuresets: list[FeatureSet], reqs: set[str]
+        cls,
+        featuresets: list[FeatureSet] | dict[str, FeatureSet],
+        reqs: set[str],
     ) -> set[str]:
         """Resolve all required feature-sets based on a given set of them.
 
+        Feature-sets can be passed as a list or as a dict keyed by name
+        (which avoids building one here).
+
         Throws descriptive CleanErrors if any are missing.
         """
-        fsets = {f.name: f for f in featuresets}
+        fsets = (
+            featuresets
+            if isinstance(featuresets, dict)
+            else {f.name: f for f in featuresets}
+        )
         reqs_out = set[str]()
         for req in reqs:
-            cls._resolve_requirements(fsets, reqs_out, req)
+            featureset = fsets.get(req)
+            if featureset is None:
+                raise CleanError(f"Required featureset '{req}' not found.")
+
+            # Use precalced closures where we have them.
+            closure = featureset._requirements_closure
+            if closure is None:
+                closure = cls._resolve_requirements(fsets, req)
+            reqs_out.update(closure)
         return reqs_out
 
     @classmethod
     def _resolve_requirements(
-        cls, featuresets: dict[str, FeatureSet], reqs_out: set[str], req: str
+        cls, featuresets: dict[str, FeatureSet], req: str
+    ) -> set[str]:
+        """Return req plus all feature-sets it requires (recursively)."""
+        reqs_out = set[str]()
+        pending = [req]
+        while pending:
+            req = pending.pop()
+            if req in reqs_out:
+                continue
+            featureset = featuresets.get(req)
+            if featureset is None:
+                raise CleanError(f"Required featureset '{req}' not found.")
+            reqs_out.add(req)
+            pending.extend(featureset.requirements)
+        return reqs_out
+
+    @classmethod
+    def _calc_requirement_closures(
+        cls, featuresets: dict[str, FeatureSet]
     ) -> None:
-        if req in reqs_out:
-            return
-        featureset = featuresets.get(req)
-        if featureset is None:
-            raise CleanError(f"Required featureset '{req}' not found.")
-        reqs_out.add(req)
-        for sub_req in featureset.requirements:
-            cls._resolve_requirements(featuresets, reqs_out, sub_req)
+        """Precalc full requirement sets for a complete feature-set map."""
+        for featureset in featuresets.values():
+            featureset._requirements_closure = frozenset(
+                cls._resolve_requirements(featuresets, featureset.name)
+            )
 
     def __init__(self, name: str):
         self.requirements = set[str]()
@@ -78,14 +141,27 @@ class FeatureSet:
         # ballistica feature-set based namespace scheme)
         self.cpp_namespace_check_disable_files = set[str]()
 
+        # Our name plus everything we require (recursively); calced
+        # once all feature-sets for a project are loaded.
+        self._requirements_closure: frozenset[str] | None = None
+
         # Our standard snake_case name.
         self._name = name
 
+        # Our base name never changes, so precalc variations based on it.
+        self._name_compact = name.replace('_', '')
+        self._name_python_package = f'ba{self._name_compact}'
+        self._name_python_package_meta = f'ba{self._name_compact}meta'
+        self._name_python_binary_module = f'_ba{self._name_compact}'
+
         # Generate a default title form (foo_bar -> Foo Bar). The
         # feature-set config can customize this; for example a word like
         # base_sdk might look better as 'Base SDK' instead of the
-        # default 'Base Sdk'.
-        self._name_title = snake_case_to_title(self._name)
+        # default 'Base Sdk'. Our name is already validated (no empty
+        # words), so this matches efro.util.snake_case_to_title() without
+        # the split/join.
+        self._name_title = name.replace('_', ' ').title()
+        self._name_camel = self._name_title.replace(' ', '')
 
     @property
     def name(self) -> str:
@@ -95,7 +171,7 @@ class FeatureSet:
     @property
     def name_compact(self) -> str:
         """Compact name variation (foo_bar -> foobar). Used for Python bits."""
-        return self._name.replace('_', '')
+        return self._name_compact
 
     @property
     def name_title(self) -> str:
@@ -125,28 +201,29 @@ class FeatureSet:
 
         # Ok val; we will accept you.
         self._name_title = val
+        self._name_camel = val.replace(' ', '')
 
     @property
     def name_camel(self) -> str:
         """Camel case name (foo_bar -> FooBar). Used for classes, etc."""
         # We want to use any of the customization applied to name_title
-        # so let's just give _name_title with spaces stripped out.
-        return self._name_title.replace(' ', '')
+        # so this is just _name_title with spaces stripped out.
+        return self._name_camel
 
     @property
     def name_python_package(self) -> str:
         """Python package name (foo_bar -> bafoobar)."""
-        return f'ba{self.name_compact}'
+        return self._name_python_package
 
     @property
     def name_python_package_meta(self) -> str:
         """The name of our meta python package."""
-        return f'ba{self.name_compact}meta'
+        return self._name_python_package_meta
 
     @property
     def name_python_binary_module(self) -> str:
         """Python binary module name (foo_bar -> _bafoobar)."""
-        return f'_ba{self.name_compact}'
+        return self._name_python_binary_module
 
     @staticmethod
     def validate_name(name: str) -> None:
@@ -155,6 +232,11 @@ class FeatureSet:
         Throws descriptive CleanErrors if provided name is invalid.
         """
 
+        # Fast path; the checks below are only needed to accept unusual
+        # names or to describe what is wrong with invalid ones.
+        if _VALID_NAME_RE.fullmatch(name) is not None:
+            return
+
         # Disallow empty.
         if not name:
             raise CleanError('Feature set name cannot be empty.')
@@ -195,61 +277,81 @@ class FeatureSet:
 
         For use by settings scripts.
         """
-        if cls._active_feature_set is None:
+        featureset: FeatureSet | None = getattr(_g_active, 'featureset', None)
+        if featureset is None:
             raise RuntimeError('No FeatureSet being actively defined.')
-        return cls._active_feature_set
+        return featureset
 
     def apply_config(self, config_path: str) -> None:
         """Apply a user config to this feature-set."""
         # pylint: disable=exec-used
         try:
-            assert self._active_feature_set is None
-            type(self)._active_feature_set = self
+            assert getattr(_g_active, 'featureset', None) is None
+            _g_active.featureset = self
 
             # Apply both src and dist spinoff configs.
             exec_context: dict = {}
-            with open(config_path, encoding='utf-8') as infile:
-                config_contents = infile.read()
-
-            # Use compile here so we can provide a nice file path for
-            # error tracebacks.
-            exec(
-                compile(config_contents, config_path, 'exec'),
-                exec_context,
-                exec_context,
-            )
+            key = (config_path, os.stat(config_path).st_mtime_ns)
+            code = _g_compiled_configs.get(key)
+            if code is None:
+                with open(config_path, encoding='utf-8') as infile:
+                    config_contents = infile.read()
+
+                # Use compile here so we can provide a nice file path for
+                # error tracebacks.
+                code = compile(config_contents, config_path, 'exec')
+                _g_compiled_configs[key] = code
+            exec(code, exec_context, exec_context)
 
         finally:
-            assert type(self)._active_feature_set is self
-            type(self)._active_feature_set = None
+            assert _g_active.featureset is self
+            _g_active.featureset = None
 
 
-def _build_feature_set_list(project_root: str) -> list[FeatureSet]:
-    featuresets: list[FeatureSet] = []
+def _scan_feature_set_configs(project_root: str) -> list[tuple[str, str]]:
+    """Return sorted (name, path) pairs for a project's feature-set configs."""
     fsdir = os.path.join(project_root, 'config', 'featuresets')
     prefix = 'featureset_'
-    filenames = os.listdir(fsdir)
-    for filename in sorted(filenames):
-        if not filename.endswith('.py'):
-            continue
-        if not filename.startswith(prefix):
+    with os.scandir(fsdir) as it:
+        entries = [e for e in it if e.name.endswith('.py') and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    configs: list[tuple[str, str]] = []
+    for entry in entries:
+        if not entry.name.startswith(prefix):
             raise CleanError(
-                f"Found invalid featuresetdef filename: '{filename}'."
+                f"Found invalid featuresetdef filename: '{entry.name}'."
             )
-        basename, _ext = os.path.splitext(filename.removeprefix(prefix))
-        featureset = FeatureSet(basename)
-        featureset.apply_config(os.path.join(fsdir, filename))
+        configs.append((entry.name[len(prefix) : -len('.py')], entry.path))
+    return configs
+
+
+def _build_feature_set_map(project_root: str) -> dict[str, FeatureSet]:
+    """Return a project's feature-sets keyed by name (in name order)."""
+    featuresets: list[FeatureSet] = []
+    for name, config_path in _scan_feature_set_configs(project_root):
+        featureset = FeatureSet(name)
+        featureset.apply_config(config_path)
         featuresets.append(featureset)
 
     # Run some sanity checks to make sure our featuresets don't have
     # clashing names/etc. (for instance, foo_v1 and foov_1 would resolve
     # to the same foov1 py module name).
 
-    fsnames = {f.name for f in featuresets}
-    assert len(fsnames) == len(featuresets)
-
-    assert len({f.name_compact for f in featuresets}) == len(featuresets)
-    assert len({f.name_compact for f in featuresets}) == len(featuresets)
+    fsmap: dict[str, FeatureSet] = {}
+    compact_names: dict[str, str] = {}
+    for featureset in featuresets:
+        if featureset.name in fsmap:
+            raise CleanError(
+                f"Feature-set name '{featureset.name}' is defined twice."
+            )
+        fsmap[featureset.name] = featureset
+        other = compact_names.get(featureset.name_compact)
+        if other is not None:
+            raise CleanError(
+                f"Feature-sets '{other}' and '{featureset.name}' both"
+                f" resolve to compact name '{featureset.name_compact}'."
+            )
+        compact_names[featureset.name_compact] = featureset.name
 
     for featureset in featuresets:
         for req in featureset.requirements:
@@ -258,11 +360,11 @@ def _build_feature_set_list(project_root: str) -> list[FeatureSet]:
                     f"Feature-set '{featureset.name}'"
                     f' lists itself as a requirement; this is not allowed.'
                 )
-            if req not in fsnames:
+            if req not in fsmap:
                 raise CleanError(
                     f"Undefined feature-set '{req}'"
                     f' listed as a requirement of feature-set'
                     f" '{featureset.name}'."
                 )
 
-    return featuresets
+    return fsmap
@@ -295,8 +295,7 @@ class SpinoffContext:
         # Also always include 'core' since we'd be totally broken
         # without it.
         reqs = FeatureSet.resolve_requirements(
-            list(self._src_all_feature_sets.values()),
-            self.src_feature_sets | {'core'},
+            self._src_all_feature_sets, self.src_feature_sets | {'core'}
         )
 
         # Now simply return any sets *not* included in our resolved set.
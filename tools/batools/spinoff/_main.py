@@ -6,9 +6,8 @@ from __future__ import annotations
 
 import os
 import sys
-import subprocess
 from enum import Enum
-from typing import assert_never
+from typing import TYPE_CHECKING, assert_never
 
 from efro.error import CleanError
 from efro.terminal import Clr
@@ -16,6 +15,9 @@ from efrotools import replace_exact
 import batools.spinoff
 from batools.spinoff._context import SpinoffContext
 
+if TYPE_CHECKING:
+    from typing import Callable
+
 
 class Command(Enum):
     """Our top level commands."""
@@ -33,6 +35,51 @@ class Command(Enum):
     CREATE = 'create'
 
 
+# Commands that simply do a single SpinoffContext run.
+_SINGLE_RUN_MODES: dict[Command, SpinoffContext.Mode] = {
+    Command.STATUS: SpinoffContext.Mode.STATUS,
+    Command.UPDATE: SpinoffContext.Mode.UPDATE,
+    Command.CHECK: SpinoffContext.Mode.CHECK,
+    Command.CLEAN_LIST: SpinoffContext.Mode.CLEAN_LIST,
+    Command.CLEAN: SpinoffContext.Mode.CLEAN,
+    Command.CLEAN_CHECK: SpinoffContext.Mode.CLEAN_CHECK,
+    Command.DIFF: SpinoffContext.Mode.DIFF,
+}
+
+# Static help text (Clr values are fixed at import time).
+_AVAILABLE_COMMANDS_MSG = (
+    'Available commands:\n'
+    f'  {Clr.SBLU}status{Clr.RST}              '
+    'Print list of files update would affect.\n'
+    f'  {Clr.SBLU}diff{Clr.RST}                '
+    'Print diffs for what update would do.\n'
+    f'  {Clr.SBLU}update{Clr.RST}              '
+    'Sync all spinoff files from src project.\n'
+    f'  {Clr.SBLU}check{Clr.RST}               '
+    'Make sure everything is kosher.\n'
+    f'  {Clr.SBLU}clean{Clr.RST}               '
+    'Remove all spinoff files'
+    ' (minus a few such as .gitignore).\n'
+    f'  {Clr.SBLU}cleanlist{Clr.RST}           '
+    'Shows what clean would do.\n'
+    f'  {Clr.SBLU}override [file...]{Clr.RST}  '
+    'Remove files from spinoff, leaving local copies in place.\n'
+    f'  {Clr.SBLU}backport [file]{Clr.RST}     '
+    'Help get changes to spinoff dst files back to src.\n'
+    f'  {Clr.SBLU}featuresets{Clr.RST}         '
+    'List featuresets present in the current project.\n'
+    f'  {Clr.SBLU}create [name, path]{Clr.RST} '
+    'Create a new spinoff project based on this src one.\n'
+    '                      Name should be in CamelCase form.\n'
+    '                      Use --featuresets a,b to specify included'
+    ' feature-sets.\n'
+    "                      Pass 'none' or an empty string for no"
+    ' featuresets.\n'
+    '                      If unspecified, all src feature-sets will be'
+    ' included.'
+)
+
+
 def spinoff_main() -> None:
     """Main script entry point."""
     try:
@@ -43,8 +90,6 @@ def spinoff_main() -> None:
 
 
 def _main() -> None:
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
     if len(sys.argv) < 2:
         print(f'{Clr.RED}Error: Expected a command argument.{Clr.RST}')
         _print_available_commands()
@@ -80,53 +125,51 @@ def _main() -> None:
     # else:
     #     src_root = os.path.join(dst_root, 'submodules', 'ballistica')
 
-    single_run_mode: SpinoffContext.Mode | None = None
-
-    if cmd is Command.STATUS:
-        single_run_mode = SpinoffContext.Mode.STATUS
-    elif cmd is Command.UPDATE:
-        single_run_mode = SpinoffContext.Mode.UPDATE
-    elif cmd is Command.CHECK:
-        single_run_mode = SpinoffContext.Mode.CHECK
-    elif cmd is Command.CLEAN_LIST:
-        single_run_mode = SpinoffContext.Mode.CLEAN_LIST
-    elif cmd is Command.CLEAN:
-        single_run_mode = SpinoffContext.Mode.CLEAN
-    elif cmd is Command.CLEAN_CHECK:
-        single_run_mode = SpinoffContext.Mode.CLEAN_CHECK
-    elif cmd is Command.DIFF:
-        single_run_mode = SpinoffContext.Mode.DIFF
-    elif cmd is Command.OVERRIDE:
-        _do_override(src_root, dst_root)
-    elif cmd is Command.BACKPORT:
-        _do_backport(src_root, dst_root)
-    elif cmd is Command.FEATURESETS:
-        _do_featuresets(dst_root)
-    elif cmd is Command.CREATE:
-        _do_create(src_root, dst_root)
-    else:
-        assert_never(cmd)
-
-    if single_run_mode is not None:
-        if src_root is None:
-            if '--soft' in sys.argv:
-                return
-            raise CleanError(
-                'This only works on dst projects;'
-                ' you appear to be in a src project.'
-                " To silently no-op in this case, pass '--soft'."
-            )
-        # SpinoffContext should never be relying on relative paths, so let's
-        # keep ourself honest by making sure.
-        os.chdir('/')
-        SpinoffContext(
-            src_root,
-            dst_root,
-            single_run_mode,
-            force='--force' in sys.argv,
-            verbose='--verbose' in sys.argv,
-            print_full_lists='--full' in sys.argv,
-        ).run()
+    # Exhaustive so the type-checker flags any command we don't route.
+    match cmd:
+        case (
+            Command.STATUS
+            | Command.UPDATE
+            | Command.CHECK
+            | Command.CLEAN_LIST
+            | Command.CLEAN
+            | Command.CLEAN_CHECK
+            | Command.DIFF
+        ):
+            _do_single_run(src_root, dst_root, _SINGLE_RUN_MODES[cmd])
+        case (
+            Command.OVERRIDE
+            | Command.BACKPORT
+            | Command.FEATURESETS
+            | Command.CREATE
+        ):
+            _COMMAND_HANDLERS[cmd](src_root, dst_root)
+        case _:
+            assert_never(cmd)
+
+
+def _do_single_run(
+    src_root: str | None, dst_root: str, mode: SpinoffContext.Mode
+) -> None:
+    if src_root is None:
+        if '--soft' in sys.argv:
+            return
+        raise CleanError(
+            'This only works on dst projects;'
+            ' you appear to be in a src project.'
+            " To silently no-op in this case, pass '--soft'."
+        )
+    # SpinoffContext should never be relying on relative paths, so let's
+    # keep ourself honest by making sure.
+    os.chdir('/')
+    SpinoffContext(
+        src_root,
+        dst_root,
+        mode,
+        force='--force' in sys.argv,
+        verbose='--verbose' in sys.argv,
+        print_full_lists='--full' in sys.argv,
+    ).run()
 
 
 def _do_create(src_root: str | None, dst_root: str) -> None:
@@ -135,25 +178,21 @@ def _do_create(src_root: str | None, dst_root: str) -> None:
     if src_root is not None:
         raise CleanError('This only works on src projects.')
 
-    args = sys.argv[2:]
+    args = iter(sys.argv[2:])
     args2: list[str] = []
-    i = 0
 
     featuresets: set[str] | None = None
 
-    while i < len(args):
-        if args[i] == '--featuresets':
-            if i >= len(args) - 1:
+    for arg in args:
+        if arg == '--featuresets':
+            fsarg = next(args, None)
+            if fsarg is None:
                 raise CleanError('--featuresets must be followed by an arg.')
-            fsarg = args[i + 1]
-            if fsarg in {'', 'none'}:
-                featuresets = set()
-            else:
-                featuresets = set(fsarg.split(','))
-            i += 2
+            featuresets = (
+                set() if fsarg in {'', 'none'} else set(fsarg.split(','))
+            )
         else:
-            args2.append(args[i])
-            i += 1
+            args2.append(arg)
 
     if len(args2) != 2:
         raise CleanError(f'Expected a name and path arg; got {args2}.')
@@ -172,18 +211,13 @@ def _do_create(src_root: str | None, dst_root: str) -> None:
     # - a tools/spinoff symlink pointing to our src project's tools/spinoff
     # - a config/spinoffconfig.py
 
-    subprocess.run(['mkdir', '-p', path], check=True)
-    subprocess.run(['mkdir', os.path.join(path, 'tools')], check=True)
-    subprocess.run(['mkdir', os.path.join(path, 'config')], check=True)
-
-    subprocess.run(
-        [
-            'ln',
-            '-s',
-            os.path.join(dst_root, 'tools', 'spinoff'),
-            os.path.join(path, 'tools'),
-        ],
-        check=True,
+    os.makedirs(path)
+    os.mkdir(os.path.join(path, 'tools'))
+    os.mkdir(os.path.join(path, 'config'))
+
+    os.symlink(
+        os.path.join(dst_root, 'tools', 'spinoff'),
+        os.path.join(path, 'tools', 'spinoff'),
     )
 
     # Read in the dummy module we use as a template.
@@ -227,13 +261,14 @@ def _do_create(src_root: str | None, dst_root: str) -> None:
 def _do_featuresets(dst_root: str) -> None:
     from batools.featureset import FeatureSet
 
-    featuresets = FeatureSet.get_all_for_project(dst_root)
+    # We only need names here; no need to run configs.
+    fsnames = FeatureSet.get_all_names_for_project(dst_root)
     print(
-        f'{Clr.BLD}{len(featuresets)}'
+        f'{Clr.BLD}{len(fsnames)}'
         f' feature-sets present in this project:{Clr.RST}'
     )
-    for fset in featuresets:
-        print(f'  {Clr.BLU}{fset.name}{Clr.RST}')
+    for fsname in fsnames:
+        print(f'  {Clr.BLU}{fsname}{Clr.RST}')
 
 
 def _do_override(src_root: str | None, dst_root: str) -> None:
@@ -301,39 +336,13 @@ def _do_backport(src_root: str | None, dst_root: str) -> None:
 
 
 def _print_available_commands() -> None:
-    bgn = Clr.SBLU
-    end = Clr.RST
-    print(
-        (
-            'Available commands:\n'
-            f'  {bgn}status{end}              '
-            'Print list of files update would affect.\n'
-            f'  {bgn}diff{end}                '
-            'Print diffs for what update would do.\n'
-            f'  {bgn}update{end}              '
-            'Sync all spinoff files from src project.\n'
-            f'  {bgn}check{end}               '
-            'Make sure everything is kosher.\n'
-            f'  {bgn}clean{end}               '
-            'Remove all spinoff files'
-            ' (minus a few such as .gitignore).\n'
-            f'  {bgn}cleanlist{end}           '
-            'Shows what clean would do.\n'
-            f'  {bgn}override [file...]{end}  '
-            'Remove files from spinoff, leaving local copies in place.\n'
-            f'  {bgn}backport [file]{end}     '
-            'Help get changes to spinoff dst files back to src.\n'
-            f'  {bgn}featuresets{end}         '
-            'List featuresets present in the current project.\n'
-            f'  {bgn}create [name, path]{end} '
-            'Create a new spinoff project based on this src one.\n'
-            '                      Name should be in CamelCase form.\n'
-            '                      Use --featuresets a,b to specify included'
-            ' feature-sets.\n'
-            "                      Pass 'none' or an empty string for no"
-            ' featuresets.\n'
-            '                      If unspecified, all src feature-sets will be'
-            ' included.'
-        ),
-        file=sys.stderr,
-    )
+    print(_AVAILABLE_COMMANDS_MSG, file=sys.stderr)
+
+
+# Handlers for all commands not covered by _SINGLE_RUN_MODES.
+_COMMAND_HANDLERS: dict[Command, Callable[[str | None, str], None]] = {
+    Command.OVERRIDE: _do_override,
+    Command.BACKPORT: _do_backport,
+    Command.FEATURESETS: lambda _src_root, dst_root: _do_featuresets(dst_root),
+    Command.CREATE: _do_create,
+}